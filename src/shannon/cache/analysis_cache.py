@@ -7,6 +7,7 @@ Includes context hashing to ensure cached results match current project state.
 
 import hashlib
 import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
@@ -31,6 +32,9 @@ class AnalysisCache:
         - Timestamp
     """
 
+    # Bounded memo for compute_key (save + get hash the same spec twice)
+    KEY_CACHE_SIZE = 1024
+
     def __init__(self, cache_dir: Optional[Path] = None, ttl_days: int = 7):
         """
         Initialize analysis cache.
@@ -47,6 +51,11 @@ class AnalysisCache:
         # Initialize stats
         self.stats = self._load_stats()
 
+        # Memoized cache keys: (spec_text, version, model, context_hash) → key.
+        # A save immediately followed by a get would otherwise SHA-256 the
+        # full spec body twice; repeat analyses of the same spec hit it too.
+        self._key_cache: Dict[Tuple[str, str, str, Optional[str]], str] = {}
+
     def _load_stats(self) -> Dict[str, Any]:
         """Load cache statistics from disk."""
         if not self.stats_file.exists():
@@ -60,14 +69,14 @@ class AnalysisCache:
             }
 
         try:
-            return json.loads(self.stats_file.read_text())
+            return json.loads(self.stats_file.read_bytes())
         except (json.JSONDecodeError, OSError):
             return self._load_stats.__defaults__[0]
 
     def _save_stats(self) -> None:
         """Save cache statistics to disk atomically."""
         temp_file = self.stats_file.with_suffix('.tmp')
-        temp_file.write_text(json.dumps(self.stats, indent=2))
+        temp_file.write_bytes(json.dumps(self.stats, separators=(',', ':')).encode('utf-8'))
         temp_file.rename(self.stats_file)
 
     def compute_key(
@@ -92,21 +101,36 @@ class AnalysisCache:
         Returns:
             64-character hex SHA-256 hash
         """
-        # Build composite key parts
-        key_parts = [
-            spec_text,
-            framework_version,
-            model
-        ]
+        # Reduce context to its short hash first so the memo key is hashable
+        context_hash = self._hash_context(context) if context else None
+
+        memo_key = (spec_text, framework_version, model, context_hash)
+        key = self._key_cache.get(memo_key)
+        if key is not None:
+            return key
+
+        # Feed the parts into the digest incrementally ('|'-separated, same
+        # layout as the old joined composite) instead of materializing the
+        # spec-sized intermediate string plus its UTF-8 copy.
+        h = hashlib.sha256()
+        h.update(spec_text.encode('utf-8'))
+        h.update(b'|')
+        h.update(framework_version.encode('utf-8'))
+        h.update(b'|')
+        h.update(model.encode('utf-8'))
 
         # Include context hash if present
-        if context:
-            context_hash = self._hash_context(context)
-            key_parts.append(context_hash)
+        if context_hash is not None:
+            h.update(b'|')
+            h.update(context_hash.encode('utf-8'))
+
+        key = h.hexdigest()
 
-        # Compute SHA-256 hash of all parts
-        composite = "|".join(key_parts)
-        return hashlib.sha256(composite.encode('utf-8')).hexdigest()
+        if len(self._key_cache) >= self.KEY_CACHE_SIZE:
+            # Bounded FIFO: drop the oldest memoized key
+            self._key_cache.pop(next(iter(self._key_cache)))
+        self._key_cache[memo_key] = key
+        return key
 
     def _hash_context(self, context: Dict[str, Any]) -> str:
         """
@@ -125,16 +149,32 @@ class AnalysisCache:
         Returns:
             16-character hex hash of canonical context
         """
-        relevant = {
-            'project_id': context.get('project_id'),
-            'tech_stack': sorted(context.get('tech_stack', [])),
-            'file_paths': sorted(context.get('loaded_files', {}).keys())
-        }
+        # Canonical representation built directly: the field set is fixed
+        # (project_id, tech_stack, file_paths in that order), avoiding a
+        # JSON encoder pass per key computation. Every element is length-
+        # prefixed and each list is count-prefixed so the encoding is
+        # injective - plain joins are not ('a,b' vs ['a', 'b'] collide),
+        # and this hash decides cache-key identity.
+        h = hashlib.sha256()
+
+        def feed(part: str) -> None:
+            encoded = part.encode('utf-8')
+            h.update(b'%d:' % len(encoded))
+            h.update(encoded)
 
-        # Canonical JSON representation
-        canonical = json.dumps(relevant, sort_keys=True)
-        full_hash = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
-        return full_hash[:16]  # First 16 chars for brevity
+        feed(str(context.get('project_id')))
+
+        tech_stack = sorted(context.get('tech_stack', []))
+        h.update(b'%d;' % len(tech_stack))
+        for item in tech_stack:
+            feed(item)
+
+        file_paths = sorted(context.get('loaded_files', {}).keys())
+        h.update(b'%d;' % len(file_paths))
+        for path in file_paths:
+            feed(path)
+
+        return h.hexdigest()[:16]  # First 16 chars for brevity
 
     def get(
         self,
@@ -183,7 +223,7 @@ class AnalysisCache:
 
         # Load and return
         try:
-            result = json.loads(cache_file.read_text())
+            result = json.loads(cache_file.read_bytes())
 
             # Add cache hit metadata
             result['_cache_hit'] = True
@@ -246,7 +286,9 @@ class AnalysisCache:
 
         # Atomic write: temp file + rename
         temp_file = cache_file.with_suffix('.tmp')
-        temp_file.write_text(json.dumps(cached_result, indent=2))
+        temp_file.write_bytes(
+            json.dumps(cached_result, separators=(',', ':')).encode('utf-8')
+        )
         temp_file.rename(cache_file)
 
         # Record save
@@ -280,21 +322,35 @@ class AnalysisCache:
         total_requests = self.stats["hits"] + self.stats["misses"]
         hit_rate = (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0.0
 
+        file_count, total_bytes = self._scan_cache_files()
+
         return {
             **self.stats,
             "total_requests": total_requests,
             "hit_rate_percent": round(hit_rate, 2),
-            "cache_size_files": len(list(self.cache_dir.glob("*.json"))) - 1,  # Exclude stats.json
-            "cache_size_mb": self._get_cache_size_mb()
+            "cache_size_files": file_count,
+            "cache_size_mb": round(total_bytes / (1024 * 1024), 2)
         }
 
+    def _scan_cache_files(self) -> Tuple[int, int]:
+        """
+        Single-pass scan of cache entries.
+
+        Returns:
+            (file_count, total_bytes) over *.json entries, excluding stats.json
+        """
+        count = 0
+        total_bytes = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.name != 'stats.json':
+                    count += 1
+                    total_bytes += entry.stat().st_size
+        return count, total_bytes
+
     def _get_cache_size_mb(self) -> float:
         """Calculate total cache size in MB."""
-        total_bytes = sum(
-            f.stat().st_size
-            for f in self.cache_dir.glob("*.json")
-            if f.name != "stats.json"
-        )
+        _, total_bytes = self._scan_cache_files()
         return round(total_bytes / (1024 * 1024), 2)
 
     def evict_old_entries(self, days: Optional[int] = None) -> int:
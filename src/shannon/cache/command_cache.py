@@ -11,9 +11,10 @@ Uses version-based keys for instant retrieval without re-execution.
 
 import hashlib
 import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 
 class CommandCache:
@@ -69,14 +70,14 @@ class CommandCache:
             }
 
         try:
-            return json.loads(self.stats_file.read_text())
+            return json.loads(self.stats_file.read_bytes())
         except (json.JSONDecodeError, OSError):
             return self._load_stats.__defaults__[0]
 
     def _save_stats(self) -> None:
         """Save cache statistics to disk atomically."""
         temp_file = self.stats_file.with_suffix('.tmp')
-        temp_file.write_text(json.dumps(self.stats, indent=2))
+        temp_file.write_bytes(json.dumps(self.stats, separators=(',', ':')).encode('utf-8'))
         temp_file.rename(self.stats_file)
 
     def _is_cacheable(self, command: str) -> bool:
@@ -164,7 +165,7 @@ class CommandCache:
 
         # Load and return
         try:
-            cached = json.loads(cache_file.read_text())
+            cached = json.loads(cache_file.read_bytes())
 
             # Add cache hit metadata
             result = cached.get('result', {})
@@ -229,7 +230,9 @@ class CommandCache:
 
         # Atomic write: temp file + rename
         temp_file = cache_file.with_suffix('.tmp')
-        temp_file.write_text(json.dumps(cached_entry, indent=2))
+        temp_file.write_bytes(
+            json.dumps(cached_entry, separators=(',', ':')).encode('utf-8')
+        )
         temp_file.rename(cache_file)
 
         # Record save
@@ -274,22 +277,36 @@ class CommandCache:
         total_requests = self.stats["hits"] + self.stats["misses"]
         hit_rate = (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0.0
 
+        file_count, total_bytes = self._scan_cache_files()
+
         return {
             **self.stats,
             "total_requests": total_requests,
             "hit_rate_percent": round(hit_rate, 2),
-            "cache_size_files": len(list(self.cache_dir.glob("*.json"))) - 1,  # Exclude stats.json
-            "cache_size_mb": self._get_cache_size_mb(),
+            "cache_size_files": file_count,
+            "cache_size_mb": round(total_bytes / (1024 * 1024), 3),
             "total_savings_minutes": round(self.stats["total_savings_seconds"] / 60, 2)
         }
 
+    def _scan_cache_files(self) -> Tuple[int, int]:
+        """
+        Single-pass scan of cache entries.
+
+        Returns:
+            (file_count, total_bytes) over *.json entries, excluding stats.json
+        """
+        count = 0
+        total_bytes = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.name != 'stats.json':
+                    count += 1
+                    total_bytes += entry.stat().st_size
+        return count, total_bytes
+
     def _get_cache_size_mb(self) -> float:
         """Calculate total cache size in MB."""
-        total_bytes = sum(
-            f.stat().st_size
-            for f in self.cache_dir.glob("*.json")
-            if f.name != "stats.json"
-        )
+        _, total_bytes = self._scan_cache_files()
         return round(total_bytes / (1024 * 1024), 3)
 
     def evict_old_entries(self) -> int:
@@ -344,7 +361,7 @@ class CommandCache:
                 continue
 
             try:
-                data = json.loads(cache_file.read_text())
+                data = json.loads(cache_file.read_bytes())
                 metadata = data.get('_cache_metadata', {})
 
                 mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
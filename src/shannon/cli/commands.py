@@ -346,32 +346,37 @@ def analyze(
                         instrumented_iter = interceptor.intercept(query_iter, [collector])
 
                         # Run with live dashboard (sync context manager)
-                        with dashboard:
-                            async for msg in instrumented_iter:
-                                messages.append(msg)
-                                message_count += 1
-
-                                # Pass readable message content to dashboard for display
-                                from claude_agent_sdk import TextBlock, ToolUseBlock, ThinkingBlock
-
-                                if isinstance(msg, TextBlock):
-                                    # Show Shannon's text output
-                                    dashboard.update(msg.text)
-                                elif isinstance(msg, ToolUseBlock):
-                                    # Show tool calls
-                                    dashboard.update(f"→ Tool: {msg.name}")
-                                elif isinstance(msg, ThinkingBlock):
-                                    # Show thinking (truncated)
-                                    thinking_preview = msg.thinking[:100] + "..." if len(msg.thinking) > 100 else msg.thinking
-                                    dashboard.update(f"💭 {thinking_preview}")
-                                elif hasattr(msg, 'content'):
-                                    # Handle other message types with content
-                                    for block in msg.content:
-                                        if isinstance(block, TextBlock):
-                                            dashboard.update(block.text)
-                                        elif isinstance(block, ToolUseBlock):
-                                            dashboard.update(f"→ Tool: {block.name}")
-
+                        try:
+                            with dashboard:
+                                async for msg in instrumented_iter:
+                                    messages.append(msg)
+                                    message_count += 1
+
+                                    # Pass readable message content to dashboard for display
+                                    from claude_agent_sdk import TextBlock, ToolUseBlock, ThinkingBlock
+
+                                    if isinstance(msg, TextBlock):
+                                        # Show Shannon's text output
+                                        dashboard.update(msg.text)
+                                    elif isinstance(msg, ToolUseBlock):
+                                        # Show tool calls
+                                        dashboard.update(f"→ Tool: {msg.name}")
+                                    elif isinstance(msg, ThinkingBlock):
+                                        # Show thinking (truncated)
+                                        thinking_preview = msg.thinking[:100] + "..." if len(msg.thinking) > 100 else msg.thinking
+                                        dashboard.update(f"💭 {thinking_preview}")
+                                    elif hasattr(msg, 'content'):
+                                        # Handle other message types with content
+                                        for block in msg.content:
+                                            if isinstance(block, TextBlock):
+                                                dashboard.update(block.text)
+                                            elif isinstance(block, ToolUseBlock):
+                                                dashboard.update(f"→ Tool: {block.name}")
+
+                        finally:
+                            # Close the interceptor chain so workers finalize even on
+                            # early exit or error
+                            await instrumented_iter.aclose()
                         console.print("\n[dim]Analysis complete, processing results...[/dim]\n")
 
                         # Show final metrics from collector
@@ -759,34 +764,39 @@ def wave(request: str, session_id: Optional[str], verbose: bool) -> None:
                 wave_iter = client.invoke_command('/shannon:wave', request)
                 instrumented_iter = interceptor.intercept(wave_iter, [collector])
 
-                with dashboard:
-                    async for msg in instrumented_iter:
-                        messages.append(msg)
+                try:
+                    with dashboard:
+                        async for msg in instrumented_iter:
+                            messages.append(msg)
                         
-                        # V3: Track message with agent tracker
-                        if agent_id and orchestrator and orchestrator.agents:
-                            try:
-                                orchestrator.agents.add_message(agent_id, msg)
-                            except:
-                                pass  # Don't fail wave if tracking fails
-
-                        # Pass readable messages to dashboard
-                        from claude_agent_sdk import TextBlock, ToolUseBlock, ThinkingBlock
-
-                        if isinstance(msg, TextBlock):
-                            dashboard.update(msg.text)
-                        elif isinstance(msg, ToolUseBlock):
-                            dashboard.update(f"→ Tool: {msg.name}")
-                        elif isinstance(msg, ThinkingBlock):
-                            preview = msg.thinking[:100] + "..." if len(msg.thinking) > 100 else msg.thinking
-                            dashboard.update(f"💭 {preview}")
-                        elif hasattr(msg, 'content'):
-                            for block in msg.content:
-                                if isinstance(block, TextBlock):
-                                    dashboard.update(block.text)
-                                elif isinstance(block, ToolUseBlock):
-                                    dashboard.update(f"→ Tool: {block.name}")
+                            # V3: Track message with agent tracker
+                            if agent_id and orchestrator and orchestrator.agents:
+                                try:
+                                    orchestrator.agents.add_message(agent_id, msg)
+                                except:
+                                    pass  # Don't fail wave if tracking fails
+
+                            # Pass readable messages to dashboard
+                            from claude_agent_sdk import TextBlock, ToolUseBlock, ThinkingBlock
+
+                            if isinstance(msg, TextBlock):
+                                dashboard.update(msg.text)
+                            elif isinstance(msg, ToolUseBlock):
+                                dashboard.update(f"→ Tool: {msg.name}")
+                            elif isinstance(msg, ThinkingBlock):
+                                preview = msg.thinking[:100] + "..." if len(msg.thinking) > 100 else msg.thinking
+                                dashboard.update(f"💭 {preview}")
+                            elif hasattr(msg, 'content'):
+                                for block in msg.content:
+                                    if isinstance(block, TextBlock):
+                                        dashboard.update(block.text)
+                                    elif isinstance(block, ToolUseBlock):
+                                        dashboard.update(f"→ Tool: {block.name}")
 
+                finally:
+                    # Close the interceptor chain so workers finalize even on
+                    # early exit or error
+                    await instrumented_iter.aclose()
                 ui.console.print("\n[dim]Wave complete, processing results...[/dim]\n")
 
             except Exception as e:
@@ -1246,25 +1256,30 @@ def task(
                 task_iter = client.invoke_command('/shannon:task', spec_text)
                 instrumented_iter = interceptor.intercept(task_iter, [collector])
 
-                with dashboard:
-                    async for msg in instrumented_iter:
-                        wave_messages.append(msg)
-
-                        # Stream messages to dashboard
-                        from claude_agent_sdk import TextBlock, ToolUseBlock, ThinkingBlock
-
-                        if isinstance(msg, TextBlock):
-                            dashboard.update(msg.text)
-                        elif isinstance(msg, ToolUseBlock):
-                            dashboard.update(f"→ Tool: {msg.name}")
-                        elif isinstance(msg, ThinkingBlock):
-                            preview = msg.thinking[:100] + "..." if len(msg.thinking) > 100 else msg.thinking
-                            dashboard.update(f"💭 {preview}")
-                        elif hasattr(msg, 'content'):
-                            for block in msg.content:
-                                if isinstance(block, TextBlock):
-                                    dashboard.update(block.text)
+                try:
+                    with dashboard:
+                        async for msg in instrumented_iter:
+                            wave_messages.append(msg)
+
+                            # Stream messages to dashboard
+                            from claude_agent_sdk import TextBlock, ToolUseBlock, ThinkingBlock
+
+                            if isinstance(msg, TextBlock):
+                                dashboard.update(msg.text)
+                            elif isinstance(msg, ToolUseBlock):
+                                dashboard.update(f"→ Tool: {msg.name}")
+                            elif isinstance(msg, ThinkingBlock):
+                                preview = msg.thinking[:100] + "..." if len(msg.thinking) > 100 else msg.thinking
+                                dashboard.update(f"💭 {preview}")
+                            elif hasattr(msg, 'content'):
+                                for block in msg.content:
+                                    if isinstance(block, TextBlock):
+                                        dashboard.update(block.text)
 
+                finally:
+                    # Close the interceptor chain so workers finalize even on
+                    # early exit or error
+                    await instrumented_iter.aclose()
             except Exception as e:
                 ui.console.print(f"[yellow]Dashboard unavailable: {e}[/yellow]\n")
 
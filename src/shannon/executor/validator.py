@@ -15,6 +15,7 @@ Part of: Shannon V3.5 Wave 3 (Validation)
 
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+from collections import deque
 from dataclasses import dataclass
 import json
 import logging
@@ -55,6 +56,10 @@ class ValidationOrchestrator:
             # Fix and retry
     """
 
+    # Most recent output lines kept per check; noisy builds can emit far
+    # more over the 5-minute window, and consumers only inspect the tail
+    OUTPUT_BUFFER_LINES = 2000
+
     def __init__(self, project_root: Path, logger: Optional[logging.Logger] = None, dashboard_client=None):
         """
         Initialize validation orchestrator
@@ -258,29 +263,28 @@ class ValidationOrchestrator:
         """Tier 1: Static validation (build, lint, types)"""
         results = {'passed': True, 'checks': {}, 'failures': []}
 
-        # Build check
+        # Build, type and lint checks are independent commands - run them
+        # concurrently so tier time is the slowest check, not the sum
+        checks = []
         if self.test_config.build_cmd:
-            build_passed = await self._run_check(self.test_config.build_cmd, "Build")
-            results['checks']['build'] = build_passed
-            if not build_passed:
-                results['passed'] = False
-                results['failures'].append("Build failed")
-
-        # Type check
+            checks.append(('build', self.test_config.build_cmd, "Build"))
         if self.test_config.type_check_cmd:
-            type_passed = await self._run_check(self.test_config.type_check_cmd, "Type check")
-            results['checks']['type_check'] = type_passed
-            if not type_passed:
-                results['passed'] = False
-                results['failures'].append("Type check failed")
-
-        # Lint check
+            checks.append(('type_check', self.test_config.type_check_cmd, "Type check"))
         if self.test_config.lint_cmd:
-            lint_passed = await self._run_check(self.test_config.lint_cmd, "Lint")
-            results['checks']['lint'] = lint_passed
-            if not lint_passed:
+            checks.append(('lint', self.test_config.lint_cmd, "Lint"))
+
+        if not checks:
+            return results
+
+        outcomes = await asyncio.gather(
+            *(self._run_check(cmd, name) for _, cmd, name in checks)
+        )
+
+        for (key, _, name), passed in zip(checks, outcomes):
+            results['checks'][key] = passed
+            if not passed:
                 results['passed'] = False
-                results['failures'].append("Lint failed")
+                results['failures'].append(f"{name} failed")
 
         return results
 
@@ -402,9 +406,10 @@ class ValidationOrchestrator:
                 stderr=asyncio.subprocess.PIPE
             )
 
-            # Stream output line-by-line
-            stdout_lines = []
-            stderr_lines = []
+            # Stream output line-by-line into bounded ring buffers so a
+            # chatty long-running command cannot grow memory without limit
+            stdout_lines = deque(maxlen=self.OUTPUT_BUFFER_LINES)
+            stderr_lines = deque(maxlen=self.OUTPUT_BUFFER_LINES)
 
             async def stream_stdout():
                 """Stream stdout and emit events"""
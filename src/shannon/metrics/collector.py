@@ -16,31 +16,61 @@ Design Decision (from SHANNON_CLI_V3_ARCHITECTURE.md):
     - Error isolation: Never raises exceptions (logs errors internally)
 """
 
+import array
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Optional, Dict, List
 from datetime import datetime
 import asyncio
 import logging
+import re
+import sys
+import time
 
 from shannon.sdk.interceptor import MessageCollector
 
 
-@dataclass
+# Precompiled text-parsing patterns. process() runs these on every message,
+# so compile once at import time instead of paying re's cache lookup per call.
+_SCORE_RE = re.compile(r'Score:\s*\*\*(\d+\.\d+)\*\*')
+_DIMENSION_RE = re.compile(r'\*\*(\w+)\s+Complexity')
+_PROGRESS_RE = re.compile(r'(?i)progress:?\s*(\d+(?:\.\d+)?)\s*%')
+_STAGE_COUNT_RE = re.compile(r'(?i)(?:dimension|stage)\s*(\d+)\s*/\s*(\d+)')
+_STAGE_NAME_RE = re.compile(r'(?i)(?:stage|phase):\s*([A-Za-z\s]+)')
+
+# Sonnet 4.5 pricing, pre-divided to per-token rates so cost accrual in the
+# usage handler is a plain multiply instead of a divide + multiply per call
+# ($3/M input, $15/M output, $0.30/M cache read, $3.75/M cache write)
+_COST_PER_INPUT_TOKEN = 3.0 / 1_000_000
+_COST_PER_OUTPUT_TOKEN = 15.0 / 1_000_000
+_COST_PER_CACHE_READ_TOKEN = 0.30 / 1_000_000
+_COST_PER_CACHE_WRITE_TOKEN = 3.75 / 1_000_000
+
+
+@dataclass(slots=True)
 class MetricsSnapshot:
     """
     Immutable snapshot of OPERATIONAL STATE and metrics
 
     Used for thread-safe reads by dashboard.
     Shows WHAT is running, WHERE we are, WHAT we're waiting for.
+
+    Slotted: one instance is built per get_snapshot() call at the 4 Hz
+    dashboard refresh, so skipping the per-instance __dict__ keeps that
+    allocation to a fixed-size slot array.
     """
     # Cost tracking
     cost_input: float = 0.0
     cost_output: float = 0.0
     cost_total: float = 0.0
 
-    # Token tracking
+    # Token tracking. Cache reads/writes are billed at different rates than
+    # uncached input, so they are tracked separately for accurate reporting
+    # in cache-warm sessions.
     tokens_input: int = 0
     tokens_output: int = 0
+    tokens_cache_read: int = 0
+    tokens_cache_write: int = 0
     tokens_total: int = 0
 
     # Timing
@@ -96,6 +126,15 @@ class MetricsCollector(MessageCollector):
         - Safe for concurrent dashboard reads
     """
 
+    # Fixed attribute set: slots drop the per-instance __dict__ and route
+    # the counter updates in the hot process() path through C descriptors
+    __slots__ = (
+        'operation_name', 'logger', '_start_monotonic', '_lock', '_metrics',
+        '_message_buffer', '_last_progress_update', '_tool_start_time',
+        '_current_tool_name', '_type_caps', '_completed_seen',
+        '_tok_in_hist', '_tok_out_hist'
+    )
+
     def __init__(
         self,
         operation_name: str = "shannon-operation",
@@ -111,7 +150,10 @@ class MetricsCollector(MessageCollector):
         self.operation_name = operation_name
         self.logger = logger or self._default_logger()
 
-        # Internal state (protected by lock)
+        # Internal state (protected by lock). start_time stays a datetime
+        # for display; the monotonic baseline drives duration math so the
+        # per-message update is one float subtraction, immune to clock steps.
+        self._start_monotonic = time.monotonic()
         self._lock = asyncio.Lock()
         self._metrics = MetricsSnapshot(
             current_operation=operation_name,
@@ -120,14 +162,30 @@ class MetricsCollector(MessageCollector):
             agent_status="ACTIVE"
         )
 
-        # Message parsing state
-        self._message_buffer: List[str] = []
+        # Message parsing state. Bounded: text fragments are only kept for
+        # recent-context parsing, so an unbounded list would grow with every
+        # streamed block over a long session.
+        self._message_buffer: deque = deque(maxlen=256)
         self._last_progress_update: Optional[datetime] = None
 
         # Tool wait tracking (NEW for operational telemetry)
         self._tool_start_time: Optional[datetime] = None
         self._current_tool_name: Optional[str] = None
 
+        # Per-type capability cache: message shape is fixed per SDK class,
+        # so probe hasattr once per type instead of 8x per message
+        self._type_caps: Dict[type, tuple] = {}
+
+        # Mirror of completed_stages for O(1) dedup; the list keeps order
+        # for display, the set answers membership
+        self._completed_seen: set = set()
+
+        # Per-usage-block token readings as packed int64 (8 B/entry vs
+        # ~28 B for a list of PyLongs) - feeds sparkline/percentile views
+        # without re-parsing messages
+        self._tok_in_hist = array.array('q')
+        self._tok_out_hist = array.array('q')
+
     async def process(self, message: Any) -> None:
         """
         Process SDK message and extract metrics
@@ -143,7 +201,7 @@ class MetricsCollector(MessageCollector):
                 self._metrics.message_count += 1
 
                 # Extract metrics based on message type
-                await self._extract_from_message(message)
+                self._extract_from_message(message)
 
         except Exception as e:
             # Error isolation: log but don't propagate
@@ -151,6 +209,27 @@ class MetricsCollector(MessageCollector):
             async with self._lock:
                 self._metrics.error_count += 1
 
+    async def process_many(self, messages: Any) -> None:
+        """
+        Process a batch of SDK messages in one pass
+
+        Amortizes the lock acquisition and async frame over the whole
+        batch: the extraction loop runs synchronously with no event-loop
+        reschedule between messages. Error isolation is per message, so
+        one malformed entry doesn't drop the rest of the batch.
+
+        Args:
+            messages: Iterable of SDK message objects
+        """
+        async with self._lock:
+            for message in messages:
+                self._metrics.message_count += 1
+                try:
+                    self._extract_from_message(message)
+                except Exception as e:
+                    self.logger.error(f"Error processing message: {e}", exc_info=True)
+                    self._metrics.error_count += 1
+
     async def on_stream_complete(self) -> None:
         """
         Called when message stream completes successfully
@@ -163,9 +242,7 @@ class MetricsCollector(MessageCollector):
                 self._metrics.is_complete = True
                 self._metrics.progress = 1.0
 
-                if self._metrics.start_time:
-                    elapsed = (self._metrics.end_time - self._metrics.start_time).total_seconds()
-                    self._metrics.duration_seconds = elapsed
+                self._metrics.duration_seconds = time.monotonic() - self._start_monotonic
 
                 self.logger.info(
                     f"Stream complete: {self._metrics.message_count} messages, "
@@ -189,9 +266,7 @@ class MetricsCollector(MessageCollector):
                 self._metrics.has_error = True
                 self._metrics.error_message = str(error)
 
-                if self._metrics.start_time:
-                    elapsed = (self._metrics.end_time - self._metrics.start_time).total_seconds()
-                    self._metrics.duration_seconds = elapsed
+                self._metrics.duration_seconds = time.monotonic() - self._start_monotonic
 
                 self.logger.error(
                     f"Stream error after {self._metrics.message_count} messages: {error}"
@@ -222,6 +297,8 @@ class MetricsCollector(MessageCollector):
             cost_total=self._metrics.cost_total,
             tokens_input=self._metrics.tokens_input,
             tokens_output=self._metrics.tokens_output,
+            tokens_cache_read=self._metrics.tokens_cache_read,
+            tokens_cache_write=self._metrics.tokens_cache_write,
             tokens_total=self._metrics.tokens_total,
             start_time=self._metrics.start_time,
             end_time=self._metrics.end_time,
@@ -244,7 +321,7 @@ class MetricsCollector(MessageCollector):
             agent_status=self._metrics.agent_status
         )
 
-    async def _extract_from_message(self, message: Any) -> None:
+    def _extract_from_message(self, message: Any) -> None:
         """
         Extract OPERATIONAL STATE from SDK message
 
@@ -258,14 +335,32 @@ class MetricsCollector(MessageCollector):
         Args:
             message: SDK message to parse
         """
-        # Get message type
-        msg_type = type(message).__name__
+        # Resolve the message shape once per concrete type. SDK message
+        # classes have fixed attribute sets, so the hasattr probes are done
+        # on first sight of a type and replayed as tuple unpacks after that.
+        msg_type = type(message)
+        caps = self._type_caps.get(msg_type)
+        if caps is None:
+            caps = (
+                hasattr(message, 'text'),
+                hasattr(message, 'content'),
+                hasattr(message, 'name'),
+                hasattr(message, 'is_error'),
+                hasattr(message, 'total_cost_usd'),
+                hasattr(message, 'usage'),
+                hasattr(message, 'duration_ms'),
+                hasattr(message, 'delta'),
+            )
+            self._type_caps[msg_type] = caps
+
+        (has_text, has_content, has_name, has_is_error,
+         has_total_cost, has_usage, has_duration_ms, has_delta) = caps
 
         # Extract text content for operational state parsing
         text_content = None
-        if hasattr(message, 'text'):
+        if has_text:
             text_content = message.text
-        elif hasattr(message, 'content') and isinstance(message.content, str):
+        elif has_content and isinstance(message.content, str):
             text_content = message.content
 
         # Parse operational state from text
@@ -280,15 +375,13 @@ class MetricsCollector(MessageCollector):
                         self._metrics.current_stage = stage[:50]  # Truncate
                         break
 
-            # Detect dimension completion (for spec analysis)
-            import re
-            score_pattern = r'Score:\s*\*\*(\d+\.\d+)\*\*'
-            dimension_pattern = r'\*\*(\w+)\s+Complexity'
-
-            if re.search(score_pattern, text_content):
+            # Detect dimension completion (for spec analysis). The literal
+            # substring check is a C-level scan that skips the regex engine
+            # for the vast majority of messages carrying no score marker.
+            score_match = _SCORE_RE.search(text_content) if 'Score:' in text_content else None
+            if score_match:
                 # Found a completed dimension
-                dim_match = re.search(dimension_pattern, text_content)
-                score_match = re.search(score_pattern, text_content)
+                dim_match = _DIMENSION_RE.search(text_content)
 
                 if dim_match and score_match:
                     dim_name = dim_match.group(1)
@@ -296,7 +389,8 @@ class MetricsCollector(MessageCollector):
 
                     # Add to completed stages
                     stage_entry = f"{dim_name} ({score:.2f})"
-                    if stage_entry not in self._metrics.completed_stages:
+                    if stage_entry not in self._completed_seen:
+                        self._completed_seen.add(stage_entry)
                         self._metrics.completed_stages.append(stage_entry)
 
                         # Update progress if this is 8D analysis (8 dimensions)
@@ -328,8 +422,10 @@ class MetricsCollector(MessageCollector):
                                 break
 
         # Detect tool calls (WAITING state)
-        if hasattr(message, 'name'):  # ToolUseBlock
-            tool_name = message.name
+        if has_name:  # ToolUseBlock
+            # Interned: the same handful of tool names recurs for the whole
+            # stream, so repeats share one string object and hash once
+            tool_name = sys.intern(message.name)
             self._metrics.current_tool = tool_name
             self._metrics.waiting_for = f"API call ({tool_name} tool)"
             self._metrics.agent_status = "WAITING"
@@ -341,7 +437,7 @@ class MetricsCollector(MessageCollector):
             self._metrics.last_activity_time = datetime.now()
 
         # Detect tool completion (results returned)
-        if hasattr(message, 'is_error'):  # ToolResultBlock
+        if has_is_error:  # ToolResultBlock
             if self._current_tool_name:
                 self._metrics.last_activity = f"✓ {self._current_tool_name} complete"
                 self._metrics.last_activity_time = datetime.now()
@@ -354,36 +450,48 @@ class MetricsCollector(MessageCollector):
             self._current_tool_name = None
 
         # Extract from ResultMessage (has final usage/cost)
-        if hasattr(message, 'total_cost_usd'):
+        if has_total_cost:
             # ResultMessage has complete usage data
             self._metrics.cost_total = message.total_cost_usd
 
-            if hasattr(message, 'usage') and isinstance(message.usage, dict):
-                self._metrics.tokens_input = message.usage.get('input_tokens', 0)
-                self._metrics.tokens_output = message.usage.get('output_tokens', 0)
+            if has_usage and isinstance(message.usage, dict):
+                usage = message.usage
+                self._metrics.tokens_input = usage.get('input_tokens', 0)
+                self._metrics.tokens_output = usage.get('output_tokens', 0)
+                self._metrics.tokens_cache_read = usage.get('cache_read_input_tokens', 0)
+                self._metrics.tokens_cache_write = usage.get('cache_creation_input_tokens', 0)
                 self._metrics.tokens_total = self._metrics.tokens_input + self._metrics.tokens_output
 
-            if hasattr(message, 'duration_ms'):
+            if has_duration_ms:
                 self._metrics.duration_seconds = message.duration_ms / 1000.0
 
         # Try to extract usage info (tokens, cost)
-        elif hasattr(message, 'usage'):
-            await self._extract_usage(message.usage)
+        elif has_usage:
+            self._extract_usage(message.usage)
 
         # Try to extract content (for progress parsing)
-        if hasattr(message, 'content'):
-            await self._extract_content(message.content)
+        if has_content:
+            self._extract_content(message.content)
 
         # Try to extract delta (streaming updates)
-        if hasattr(message, 'delta'):
-            await self._extract_delta(message.delta)
+        if has_delta:
+            self._extract_delta(message.delta)
 
         # Update timing
-        if self._metrics.start_time:
-            elapsed = (datetime.now() - self._metrics.start_time).total_seconds()
-            self._metrics.duration_seconds = elapsed
+        self._metrics.duration_seconds = time.monotonic() - self._start_monotonic
 
-    async def _extract_usage(self, usage: Any) -> None:
+    def get_token_history(self) -> tuple:
+        """
+        Get per-usage-block token readings
+
+        Returns:
+            (input_readings, output_readings) as array.array('q') - treat
+            as read-only; contiguous int64 suitable for zero-copy numeric
+            views downstream
+        """
+        return self._tok_in_hist, self._tok_out_hist
+
+    def _extract_usage(self, usage: Any) -> None:
         """
         Extract token and cost information from usage block
 
@@ -397,16 +505,28 @@ class MetricsCollector(MessageCollector):
         if hasattr(usage, 'output_tokens'):
             self._metrics.tokens_output = usage.output_tokens
 
+        # Cache tokens are billed at their own rates - without these,
+        # reported cost drifts badly in cache-warm sessions
+        self._metrics.tokens_cache_read = getattr(usage, 'cache_read_input_tokens', 0) or 0
+        self._metrics.tokens_cache_write = getattr(usage, 'cache_creation_input_tokens', 0) or 0
+
         self._metrics.tokens_total = self._metrics.tokens_input + self._metrics.tokens_output
 
-        # Calculate costs (using Sonnet 4.5 pricing)
-        # Input: $3 per million tokens
-        # Output: $15 per million tokens
-        self._metrics.cost_input = (self._metrics.tokens_input / 1_000_000) * 3.0
-        self._metrics.cost_output = (self._metrics.tokens_output / 1_000_000) * 15.0
-        self._metrics.cost_total = self._metrics.cost_input + self._metrics.cost_output
+        # Record the reading for history queries
+        self._tok_in_hist.append(self._metrics.tokens_input)
+        self._tok_out_hist.append(self._metrics.tokens_output)
+
+        # Calculate costs from the pre-divided per-token rates
+        self._metrics.cost_input = self._metrics.tokens_input * _COST_PER_INPUT_TOKEN
+        self._metrics.cost_output = self._metrics.tokens_output * _COST_PER_OUTPUT_TOKEN
+        self._metrics.cost_total = (
+            self._metrics.cost_input
+            + self._metrics.cost_output
+            + self._metrics.tokens_cache_read * _COST_PER_CACHE_READ_TOKEN
+            + self._metrics.tokens_cache_write * _COST_PER_CACHE_WRITE_TOKEN
+        )
 
-    async def _extract_content(self, content: Any) -> None:
+    def _extract_content(self, content: Any) -> None:
         """
         Extract progress information from content blocks
 
@@ -416,11 +536,11 @@ class MetricsCollector(MessageCollector):
         # Handle list of content blocks
         if isinstance(content, list):
             for block in content:
-                await self._extract_content_block(block)
+                self._extract_content_block(block)
         else:
-            await self._extract_content_block(content)
+            self._extract_content_block(content)
 
-    async def _extract_content_block(self, block: Any) -> None:
+    def _extract_content_block(self, block: Any) -> None:
         """
         Extract metrics from single content block
 
@@ -439,9 +559,9 @@ class MetricsCollector(MessageCollector):
 
             # Parse for progress indicators
             # Look for patterns like "Progress: 60%" or "Completed: 5/8"
-            await self._parse_progress_from_text(text)
+            self._parse_progress_from_text(text)
 
-    async def _extract_delta(self, delta: Any) -> None:
+    def _extract_delta(self, delta: Any) -> None:
         """
         Extract metrics from delta (streaming update)
 
@@ -451,9 +571,9 @@ class MetricsCollector(MessageCollector):
         # Similar to content extraction
         if hasattr(delta, 'text'):
             self._message_buffer.append(delta.text)
-            await self._parse_progress_from_text(delta.text)
+            self._parse_progress_from_text(delta.text)
 
-    async def _parse_progress_from_text(self, text: str) -> None:
+    def _parse_progress_from_text(self, text: str) -> None:
         """
         Parse progress indicators from text content
 
@@ -465,17 +585,25 @@ class MetricsCollector(MessageCollector):
         Args:
             text: Text to parse
         """
-        import re
-
-        # Progress percentage pattern
-        progress_match = re.search(r'(?i)progress:?\s*(\d+(?:\.\d+)?)\s*%', text)
-        if progress_match:
-            progress = float(progress_match.group(1)) / 100.0
-            self._metrics.progress = min(max(progress, 0.0), 1.0)
-            self._last_progress_update = datetime.now()
+        # Cheap marker gates: each pattern requires a literal character
+        # ('%', '/', ':'), so a C-level substring check decides in ~ns
+        # whether the regex engine needs to run at all
+        has_percent = '%' in text
+        has_slash = '/' in text
+        has_colon = ':' in text
+
+        # Progress percentage pattern. A case-folded keyword gate decides
+        # cheaply whether the regex needs to run; the pattern itself keeps
+        # the anchoring so only the percentage after 'progress' is taken.
+        if has_percent and 'rogress' in text.casefold():
+            progress_match = _PROGRESS_RE.search(text)
+            if progress_match:
+                progress = float(progress_match.group(1)) / 100.0
+                self._metrics.progress = min(max(progress, 0.0), 1.0)
+                self._last_progress_update = datetime.now()
 
         # Dimension/stage completion pattern
-        stage_match = re.search(r'(?i)(?:dimension|stage)\s*(\d+)\s*/\s*(\d+)', text)
+        stage_match = _STAGE_COUNT_RE.search(text) if has_slash else None
         if stage_match:
             current = int(stage_match.group(1))
             total = int(stage_match.group(2))
@@ -484,11 +612,14 @@ class MetricsCollector(MessageCollector):
             self._last_progress_update = datetime.now()
 
         # Stage name pattern
-        stage_name_match = re.search(r'(?i)(?:stage|phase):\s*([A-Za-z\s]+)', text)
+        stage_name_match = _STAGE_NAME_RE.search(text) if has_colon else None
         if stage_name_match:
-            stage_name = stage_name_match.group(1).strip()
+            # Interned: stage names repeat across progress messages and are
+            # membership-tested against the dedup set on every occurrence
+            stage_name = sys.intern(stage_name_match.group(1).strip())
             self._metrics.current_stage = stage_name
-            if stage_name not in self._metrics.completed_stages:
+            if stage_name not in self._completed_seen:
+                self._completed_seen.add(stage_name)
                 self._metrics.completed_stages.append(stage_name)
 
     def _default_logger(self) -> logging.Logger:
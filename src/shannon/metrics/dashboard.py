@@ -21,6 +21,7 @@ from typing import Optional, Callable
 from collections import deque
 from datetime import datetime
 import asyncio
+import time
 
 from rich.console import Console, RenderableType
 from rich.layout import Layout
@@ -34,6 +35,12 @@ from shannon.metrics.collector import MetricsCollector, MetricsSnapshot
 from shannon.metrics.keyboard import KeyboardHandler, Key
 
 
+# Shared default console: Console() probes the environment on construction
+# (terminal size, color system, encoding), so build one per process instead
+# of one per dashboard instance
+_DEFAULT_CONSOLE = Console()
+
+
 class LiveDashboard:
     """
     Two-layer live metrics dashboard
@@ -95,7 +102,7 @@ class LiveDashboard:
             session: (V3.1) SessionManager for session tracking
         """
         self.collector = collector
-        self.console = console or Console()
+        self.console = console or _DEFAULT_CONSOLE
         self.refresh_per_second = refresh_per_second
         self.buffer_size = buffer_size
 
@@ -112,7 +119,7 @@ class LiveDashboard:
                     agents=agents,
                     context=context,
                     session=session,
-                    console=console,
+                    console=self.console,
                     refresh_per_second=refresh_per_second
                 )
             except Exception as e:
@@ -129,7 +136,18 @@ class LiveDashboard:
         self.pause_requested = False
         self._live: Optional[Live] = None
         self._progress: Optional[Progress] = None
+
+        # Snapshot memo: Rich can call render() several times within one
+        # refresh window (layout recalculation), so reuse the last snapshot
+        # for up to one refresh interval instead of rebuilding it per call
         self._last_snapshot: Optional[MetricsSnapshot] = None
+        self._snapshot_ttl = 1.0 / refresh_per_second
+        self._snapshot_time = 0.0
+
+        # Last state actually rendered - used to skip the Rich layout
+        # rebuild entirely when nothing changed between update cycles
+        self._rendered_snapshot: Optional[MetricsSnapshot] = None
+        self._rendered_expanded = False
 
     def __enter__(self):
         """Start dashboard in context manager"""
@@ -203,9 +221,24 @@ class LiveDashboard:
             if streaming_message:
                 self.streaming_buffer.append(streaming_message)
             self._last_snapshot = self.collector.get_snapshot()
+            self._snapshot_time = time.monotonic()
             self._handle_keyboard()
+
+            # Skip the layout rebuild when this frame would be identical to
+            # the one on screen (idle session, no new output, same view).
+            # Never skip while waiting on a tool call: both layouts render
+            # a live elapsed-seconds counter from last_activity_time that
+            # must keep ticking even though the snapshot fields are equal.
+            if (streaming_message is None
+                    and not self._last_snapshot.waiting_for
+                    and self.expanded == self._rendered_expanded
+                    and self._last_snapshot == self._rendered_snapshot):
+                return
+
             if self._live:
                 self._live.update(self.render())
+                self._rendered_snapshot = self._last_snapshot
+                self._rendered_expanded = self.expanded
 
     def render(self) -> RenderableType:
         """
@@ -214,14 +247,28 @@ class LiveDashboard:
         Returns:
             Panel (compact) or Layout (detailed)
         """
-        # Get current snapshot
-        snapshot = self._last_snapshot or self.collector.get_snapshot()
+        # Get current snapshot (memoized for one refresh interval)
+        snapshot = self._get_snapshot()
 
         if self.expanded:
             return self._create_detailed_layout(snapshot)
         else:
             return self._create_compact_layout(snapshot)
 
+    def _get_snapshot(self) -> MetricsSnapshot:
+        """
+        Get collector snapshot, reused within one refresh interval
+
+        Returns:
+            Current (possibly memoized) MetricsSnapshot
+        """
+        now = time.monotonic()
+        if (self._last_snapshot is None
+                or (now - self._snapshot_time) >= self._snapshot_ttl):
+            self._last_snapshot = self.collector.get_snapshot()
+            self._snapshot_time = now
+        return self._last_snapshot
+
     def _create_compact_layout(self, snapshot: MetricsSnapshot) -> Panel:
         """
         Create OPERATIONAL TELEMETRY compact view
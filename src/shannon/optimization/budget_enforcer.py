@@ -267,6 +267,47 @@ class BudgetEnforcer:
         self.total_spent += actual_cost
         self._save_budget()
 
+    def record_operations(self, operations: List[Dict[str, Any]]) -> None:
+        """Record a batch of operation costs with a single save.
+
+        Equivalent to calling record_operation() per entry, but the
+        budget file is written once for the whole batch instead of once
+        per operation.
+
+        Args:
+            operations: List of dicts, each with 'name' and 'cost' keys
+                plus optional 'model', 'tokens', and 'metadata'
+
+        Example:
+            >>> enforcer = BudgetEnforcer(budget_limit=10.00)
+            >>> enforcer.record_operations([
+            ...     {'name': 'spec-analysis', 'cost': 0.52, 'tokens': 5800},
+            ...     {'name': 'wave-1', 'cost': 1.20, 'model': 'haiku'}
+            ... ])
+            >>> enforcer.total_spent
+            1.72
+        """
+        if not operations:
+            return
+
+        timestamp = datetime.now().isoformat()
+        batch_cost = 0.0
+
+        for entry in operations:
+            cost = entry['cost']
+            self.operations.append({
+                'name': entry['name'],
+                'cost': cost,
+                'model': entry.get('model', 'sonnet'),
+                'tokens': entry.get('tokens', 0),
+                'timestamp': timestamp,
+                'metadata': entry.get('metadata') or {}
+            })
+            batch_cost += cost
+
+        self.total_spent += batch_cost
+        self._save_budget()
+
     def get_status(self) -> BudgetStatus:
         """Get current budget status with all details.
 
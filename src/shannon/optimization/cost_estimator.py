@@ -6,7 +6,7 @@ wave execution, and individual agents to help users make informed decisions.
 
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
-from .model_selector import ModelSelector, MODEL_COSTS
+from .model_selector import ModelSelector, MODEL_COSTS, MODEL_COST_PER_TOKEN
 
 
 @dataclass
@@ -81,6 +81,11 @@ class CostEstimator:
             'different_project': 0.0  # Different projects share 0%
         }
 
+        # Spec estimates are pure functions of their inputs; memoize recent
+        # results so re-estimating the same spec (e.g. analyze re-runs with
+        # different flags) returns without redoing the arithmetic
+        self._spec_estimate_cache: Dict[tuple, CostEstimate] = {}
+
     def estimate_spec_analysis(
         self,
         spec_size_lines: int,
@@ -107,6 +112,11 @@ class CostEstimator:
             >>> estimate.estimated_cost_usd
             0.52  # Approximate
         """
+        cache_key = (spec_size_lines, spec_complexity)
+        cached = self._spec_estimate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         base = self.BASE_ESTIMATES['spec_analysis']
 
         # Calculate token estimate
@@ -122,7 +132,7 @@ class CostEstimator:
 
         # Calculate cost (spec analysis always uses sonnet)
         model = base['model']
-        cost = (total_tokens / 1000) * MODEL_COSTS[model]
+        cost = total_tokens * MODEL_COST_PER_TOKEN[model]
 
         # High confidence for spec analysis (well-calibrated estimates)
         confidence = 'high'
@@ -133,7 +143,7 @@ class CostEstimator:
             'complexity_adjustment': total_tokens - (base['base_tokens'] + spec_tokens)
         }
 
-        return CostEstimate(
+        estimate = CostEstimate(
             operation='spec-analysis',
             estimated_cost_usd=cost,
             estimated_tokens=total_tokens,
@@ -142,6 +152,13 @@ class CostEstimator:
             confidence=confidence
         )
 
+        # Bounded FIFO cache: drop the oldest entry once full
+        if len(self._spec_estimate_cache) >= 128:
+            self._spec_estimate_cache.pop(next(iter(self._spec_estimate_cache)))
+        self._spec_estimate_cache[cache_key] = estimate
+
+        return estimate
+
     def estimate_wave_cost(
         self,
         agents: list[Dict[str, Any]],
@@ -218,7 +235,7 @@ class CostEstimator:
             total_cost += result.estimated_cost
 
         # Add coordination overhead cost (uses sonnet)
-        overhead_cost = (wave_overhead / 1000) * MODEL_COSTS['sonnet']
+        overhead_cost = wave_overhead * MODEL_COST_PER_TOKEN['sonnet']
         total_cost += overhead_cost
 
         # Determine primary model (most common in wave)
@@ -232,7 +249,7 @@ class CostEstimator:
             'agent_costs': sum(agent_costs),
             'context_reuse_savings': (
                 sum(a.get('estimated_tokens', 50000) for a in agents) - total_tokens
-            ) / 1000 * MODEL_COSTS['sonnet']
+            ) * MODEL_COST_PER_TOKEN['sonnet']
         }
 
         return CostEstimate(
@@ -25,6 +25,10 @@ MODEL_CONTEXT_LIMITS = {
     'opus': 200_000
 }
 
+# Pre-divided per-token rates derived from MODEL_COSTS: cost estimation
+# becomes a single multiply instead of a divide plus dict lookup per call
+MODEL_COST_PER_TOKEN = {model: cost / 1000.0 for model, cost in MODEL_COSTS.items()}
+
 # Detailed pricing for accurate cost estimation
 MODEL_PRICING_DETAILED = {
     'haiku': {'input': 0.00025, 'output': 0.00125},      # Input: $0.25, Output: $1.25 per 1M
@@ -88,6 +92,8 @@ class ModelSelector:
         self.model_costs = MODEL_COSTS
         self.context_limits = MODEL_CONTEXT_LIMITS
         self.detailed_pricing = MODEL_PRICING_DETAILED
+        self._cost_per_token = MODEL_COST_PER_TOKEN
+        self._sonnet_per_token = MODEL_COST_PER_TOKEN['sonnet']
 
     def select_optimal_model(
         self,
@@ -188,8 +194,8 @@ class ModelSelector:
         Returns:
             Estimated cost in USD
         """
-        cost_per_1k = self.model_costs.get(model, self.model_costs['sonnet'])
-        return (tokens / 1000) * cost_per_1k
+        rate = self._cost_per_token.get(model, self._sonnet_per_token)
+        return tokens * rate
 
     def _calculate_savings(self, tokens: int, selected_model: str) -> float:
         """Calculate savings vs using sonnet.
@@ -201,9 +207,20 @@ class ModelSelector:
         Returns:
             Savings in USD (positive = cheaper, 0 = same, negative = more expensive)
         """
-        sonnet_cost = self._estimate_cost(tokens, 'sonnet')
-        selected_cost = self._estimate_cost(tokens, selected_model)
-        return sonnet_cost - selected_cost
+        return tokens * self._sonnet_per_token - self._estimate_cost(tokens, selected_model)
+
+    def estimate_cost_all_models(self, tokens: int) -> Dict[str, float]:
+        """Estimate cost for every known model in one pass.
+
+        Useful for ranking models by cost without repeated per-model calls.
+
+        Args:
+            tokens: Number of tokens (input + output combined)
+
+        Returns:
+            Mapping of model name to estimated cost in USD
+        """
+        return {model: tokens * rate for model, rate in self._cost_per_token.items()}
 
     def estimate_wave_savings(
         self,
@@ -48,6 +48,16 @@ class ContextAwareOrchestrator:
         result = await orchestrator.execute_analyze(spec_text)
     """
 
+    # Subsystem availability bits (see _subsystems mask built in __init__)
+    _HAS_CONTEXT = 1 << 0
+    _HAS_CACHE = 1 << 1
+    _HAS_MCP = 1 << 2
+    _HAS_AGENTS = 1 << 3
+    _HAS_OPTIMIZER = 1 << 4
+    _HAS_BUDGET = 1 << 5
+    _HAS_ANALYTICS = 1 << 6
+    _HAS_SDK = 1 << 7
+
     def __init__(self, config: Optional[ShannonConfig] = None):
         """Initialize orchestrator with all V3 subsystems.
 
@@ -123,6 +133,37 @@ class ContextAwareOrchestrator:
             logger.warning(f"AgentPool initialization failed: {e}")
             self.agent_pool = None
 
+        # Availability mask: the execute paths test subsystem presence with
+        # a single int-and per guard instead of repeated attribute lookups.
+        # Anything that replaces subsystem attributes after construction
+        # (e.g. UnifiedOrchestrator injecting its shared instances) must
+        # call _refresh_subsystems() afterwards.
+        self._refresh_subsystems()
+
+        # Last-built context summary, keyed by context object identity:
+        # the same project_context dict is reused across specs in a session
+        self._context_prompt_src: Optional[Dict[str, Any]] = None
+        self._context_prompt_summary: str = ""
+
+    def _refresh_subsystems(self) -> None:
+        """Recompute the subsystem availability mask from live attributes.
+
+        Called at the end of __init__ and again by any caller that swaps
+        subsystem attributes on a constructed instance (UnifiedOrchestrator
+        injects its shared subsystems this way); without the refresh the
+        execute-path guards would test stale init-time availability.
+        """
+        self._subsystems = (
+            (self._HAS_CONTEXT if self.context else 0)
+            | (self._HAS_CACHE if self.cache else 0)
+            | (self._HAS_MCP if self.mcp else 0)
+            | (self._HAS_AGENTS if self.agents else 0)
+            | (self._HAS_OPTIMIZER if self.model_selector and self.cost_estimator else 0)
+            | (self._HAS_BUDGET if self.budget_enforcer else 0)
+            | (self._HAS_ANALYTICS if self.analytics_db else 0)
+            | (self._HAS_SDK if self.sdk_client else 0)
+        )
+
     async def execute_analyze(
         self,
         spec_text: str,
@@ -157,7 +198,7 @@ class ContextAwareOrchestrator:
 
         # Step 1: Load project context (if specified)
         project_context = None
-        if project_id and self.context:
+        if project_id and self._subsystems & self._HAS_CONTEXT:
             try:
                 project_context = self.context.load_project(project_id)
                 logger.info(f"Loaded context for project: {project_id}")
@@ -165,13 +206,13 @@ class ContextAwareOrchestrator:
                 logger.warning(f"Context loading failed: {e}, continuing without context")
 
         # Step 2: Check cache (context-aware key)
-        if use_cache and self.cache:
+        if use_cache and self._subsystems & self._HAS_CACHE:
             try:
                 cached_result = self.cache.analysis.get(spec_text, project_context)
                 if cached_result:
                     logger.info("Cache hit! Returning cached analysis")
                     # Record cache hit to analytics
-                    if self.analytics_db:
+                    if self._subsystems & self._HAS_ANALYTICS:
                         try:
                             # Analytics tracking for cache hit
                             pass  # TODO: Add cache hit tracking
@@ -185,7 +226,7 @@ class ContextAwareOrchestrator:
         selected_model = "sonnet"  # Default
         cost_estimate = None
 
-        if self.cost_estimator and self.model_selector:
+        if self._subsystems & self._HAS_OPTIMIZER:
             try:
                 # Estimate cost for this analysis
                 cost_estimate = self.cost_estimator.estimate_spec_analysis(
@@ -194,7 +235,7 @@ class ContextAwareOrchestrator:
                 )
 
                 # Check budget
-                if self.budget_enforcer:
+                if self._subsystems & self._HAS_BUDGET:
                     budget_ok = self.budget_enforcer.check_available(cost_estimate.total_cost)
                     if not budget_ok:
                         logger.warning("Budget limit reached, but continuing...")
@@ -206,7 +247,7 @@ class ContextAwareOrchestrator:
                 selection = self.model_selector.select_optimal_model(
                     complexity_score=complexity_estimate,
                     context_size=context_size,
-                    budget_remaining=self.budget_enforcer.get_status().remaining if self.budget_enforcer else 100.0
+                    budget_remaining=self.budget_enforcer.get_status().remaining if self._subsystems & self._HAS_BUDGET else 100.0
                 )
                 selected_model = selection.selected_model
                 logger.info(f"Selected model: {selected_model} (estimated savings: ${selection.savings_vs_baseline:.2f})")
@@ -240,7 +281,7 @@ class ContextAwareOrchestrator:
         analysis_result = self._parse_analysis_result(result)
 
         # Step 7: MCP recommendations and auto-install
-        if self.mcp and 'domains' in analysis_result:
+        if self._subsystems & self._HAS_MCP and 'domains' in analysis_result:
             try:
                 mcp_recommendations = self.mcp.recommend_from_domains(
                     analysis_result['domains'],
@@ -255,7 +296,7 @@ class ContextAwareOrchestrator:
                 logger.warning(f"MCP recommendation failed: {e}")
 
         # Step 8: Save to cache (context-aware)
-        if self.cache:
+        if self._subsystems & self._HAS_CACHE:
             try:
                 self.cache.analysis.save(spec_text, analysis_result, project_context)
                 logger.info("Analysis cached for future use")
@@ -263,7 +304,7 @@ class ContextAwareOrchestrator:
                 logger.warning(f"Cache save failed: {e}")
 
         # Step 9: Record to analytics database
-        if self.analytics_db and session_id:
+        if session_id and self._subsystems & self._HAS_ANALYTICS:
             try:
                 metrics_data = metrics_collector.get_snapshot() if metrics_collector else {}
                 self.analytics_db.record_session(
@@ -279,7 +320,7 @@ class ContextAwareOrchestrator:
                 logger.warning(f"Analytics recording failed: {e}")
 
         # Step 10: Update context metadata (if project specified)
-        if project_id and self.context:
+        if project_id and self._subsystems & self._HAS_CONTEXT:
             try:
                 self.context.update_analysis_metadata(project_id, analysis_result)
                 logger.info(f"Updated context metadata for project: {project_id}")
@@ -316,7 +357,7 @@ class ContextAwareOrchestrator:
 
         # Load context
         project_context = None
-        if project_id and self.context:
+        if project_id and self._subsystems & self._HAS_CONTEXT:
             try:
                 project_context = self.context.load_project(project_id)
             except Exception as e:
@@ -331,7 +372,7 @@ class ContextAwareOrchestrator:
         result = await self._run_wave_query(prompt)
 
         # Record wave performance
-        if self.analytics_db and session_id:
+        if session_id and self._subsystems & self._HAS_ANALYTICS:
             try:
                 # Record wave execution metrics
                 pass  # TODO: Implement wave metrics recording
@@ -392,15 +433,19 @@ class ContextAwareOrchestrator:
         if not project_context:
             return base_prompt
 
-        # Inject relevant context
-        context_summary = f"""
+        # Rebuild the injected summary only when the context object changes;
+        # repeat calls with the same context reuse the cached string
+        if project_context is not self._context_prompt_src:
+            self._context_prompt_summary = f"""
 Project Context:
 - Tech Stack: {project_context.get('tech_stack', 'Unknown')}
 - Modules: {len(project_context.get('modules', []))}
 - Patterns: {', '.join(project_context.get('patterns', []))}
 
 """
-        return context_summary + base_prompt
+            self._context_prompt_src = project_context
+
+        return self._context_prompt_summary + base_prompt
 
     async def _run_analysis_query(
         self,
@@ -418,7 +463,7 @@ Project Context:
         Returns:
             Analysis result dictionary from Shannon Framework
         """
-        if not self.sdk_client:
+        if not self._subsystems & self._HAS_SDK:
             raise RuntimeError("SDK client not available")
 
         # Invoke spec-analysis skill via SDK
@@ -446,7 +491,7 @@ Project Context:
         Returns:
             Wave execution result from Shannon Framework
         """
-        if not self.sdk_client:
+        if not self._subsystems & self._HAS_SDK:
             raise RuntimeError("SDK client not available")
 
         try:
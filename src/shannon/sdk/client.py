@@ -4,6 +4,7 @@ Thin wrapper over Claude Agent SDK for invoking Shannon Framework skills.
 All algorithm logic (8D analysis, wave orchestration) lives in Shannon Framework.
 """
 
+from contextlib import aclosing
 from pathlib import Path
 from typing import AsyncIterator, Optional, Callable, Any, List
 import os
@@ -219,20 +220,23 @@ class ShannonSDKClient:
                 if self.stream_handler:
                     query_iterator = self.stream_handler.handle(query_iterator)
 
-            # Iterate messages (V2 behavior or V3 enhanced)
-            async for msg in query_iterator:
-                message_count += 1
-                msg_type = type(msg).__name__
-                self.logger.debug(f"  Message {message_count}: {msg_type}")
+            # Iterate messages (V2 behavior or V3 enhanced). aclosing
+            # guarantees the interceptor chain is closed (workers drained,
+            # lifecycle hooks run) even if our consumer stops early.
+            async with aclosing(query_iterator) as stream:
+                async for msg in stream:
+                    message_count += 1
+                    msg_type = type(msg).__name__
+                    self.logger.debug(f"  Message {message_count}: {msg_type}")
 
-                # Call progress callback if provided
-                if progress_callback:
-                    try:
-                        progress_callback(msg)
-                    except Exception as e:
-                        self.logger.warning(f"Progress callback error: {e}")
+                    # Call progress callback if provided
+                    if progress_callback:
+                        try:
+                            progress_callback(msg)
+                        except Exception as e:
+                            self.logger.warning(f"Progress callback error: {e}")
 
-                yield msg
+                    yield msg
 
             self.logger.info(f"Skill {skill_name} complete ({message_count} messages)")
 
@@ -383,15 +387,17 @@ class ShannonSDKClient:
                 if self.stream_handler:
                     query_iterator = self.stream_handler.handle(query_iterator)
             
-            # Iterate messages
-            async for msg in query_iterator:
-                if progress_callback:
-                    try:
-                        progress_callback(msg)
-                    except Exception as e:
-                        self.logger.warning(f"Progress callback error: {e}")
-                
-                yield msg
+            # Iterate messages; aclosing closes the interceptor chain
+            # even if the consumer stops early
+            async with aclosing(query_iterator) as stream:
+                async for msg in stream:
+                    if progress_callback:
+                        try:
+                            progress_callback(msg)
+                        except Exception as e:
+                            self.logger.warning(f"Progress callback error: {e}")
+
+                    yield msg
         
         except CLINotFoundError as e:
             self.logger.error("Claude Code CLI not found")
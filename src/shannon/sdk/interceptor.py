@@ -18,9 +18,11 @@ Key Design Decision (from SHANNON_CLI_V3_ARCHITECTURE.md 4.1):
 
 from typing import AsyncIterator, List, Protocol, Any, Optional
 from abc import ABC, abstractmethod
+from collections import deque
 import asyncio
+import itertools
 import logging
-from datetime import datetime
+import time
 
 
 class MessageCollector(ABC):
@@ -36,6 +38,10 @@ class MessageCollector(ABC):
         - ContextCollector: Extract file references, context usage
     """
 
+    # Empty slots so concrete collectors can opt into __slots__ themselves;
+    # subclasses that don't declare slots keep their __dict__ as before
+    __slots__ = ()
+
     @abstractmethod
     async def process(self, message: Any) -> None:
         """
@@ -49,6 +55,31 @@ class MessageCollector(ABC):
         """
         pass
 
+    async def process_many(self, messages: List[Any]) -> None:
+        """
+        Process a batch of messages
+
+        Default implementation loops over process(); collectors with a
+        cheaper bulk path (e.g. one lock acquisition per batch) override
+        this. The interceptor delivers batches when a collector's queue
+        has more than one message waiting.
+
+        Error isolation is per message, matching the one-task-per-message
+        delivery this replaced: one raising message must not drop the
+        rest of the batch.
+
+        Args:
+            messages: SDK messages in arrival order
+        """
+        for message in messages:
+            try:
+                await self.process(message)
+            except Exception as e:
+                logging.getLogger(__name__).error(
+                    f"{self.__class__.__name__}: Error processing message: {e}",
+                    exc_info=True
+                )
+
     @abstractmethod
     async def on_stream_complete(self) -> None:
         """
@@ -69,6 +100,52 @@ class MessageCollector(ABC):
         pass
 
 
+# Queue sentinel marking end of stream for collector workers
+_STREAM_END = object()
+
+
+class _Envelope:
+    """
+    Reusable carrier for one in-flight message
+
+    Pooled by _MessagePool so steady-state interception allocates no new
+    objects per message: the producer fills an envelope, the fan-out task
+    reads it and returns it to the pool.
+    """
+
+    __slots__ = ('msg', 'seq', 'ts')
+
+    def __init__(self):
+        self.msg: Any = None
+        self.seq: int = 0
+        self.ts: float = 0.0
+
+
+class _MessagePool:
+    """
+    Fixed free-list of _Envelope objects
+
+    acquire() pops from the free-list when possible and only allocates when
+    the pool is exhausted (more messages in flight than the pre-sized
+    capacity); release() clears the message reference and returns the
+    envelope for reuse.
+    """
+
+    __slots__ = ('free',)
+
+    def __init__(self, size: int):
+        self.free: List[_Envelope] = [_Envelope() for _ in range(size)]
+
+    def acquire(self) -> _Envelope:
+        if self.free:
+            return self.free.pop()
+        return _Envelope()
+
+    def release(self, env: _Envelope) -> None:
+        env.msg = None  # drop the message reference promptly
+        self.free.append(env)
+
+
 class MessageInterceptor:
     """
     Transparent async wrapper for SDK query() with parallel collectors
@@ -87,11 +164,24 @@ class MessageInterceptor:
 
     Performance Characteristics:
         - Zero added latency (messages yielded immediately)
-        - O(1) overhead per message (task creation)
+        - O(1) overhead per message (queue put, no task creation)
         - Collectors run in parallel (non-blocking)
         - Error isolation (collector failures don't affect stream)
     """
 
+    # Envelopes pre-allocated per intercept() call; bounds steady-state
+    # allocator traffic without assuming anything about stream length
+    POOL_SIZE = 256
+
+    # Per-collector queue bound: a collector that falls this far behind
+    # starts losing its oldest pending messages instead of growing without
+    # limit. The producer never blocks either way.
+    QUEUE_CAPACITY = 1024
+
+    # Max messages handed to a collector in one process_many() call when
+    # its queue has a backlog; amortizes the coroutine round-trip
+    BATCH_SIZE = 32
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         """
         Initialize message interceptor
@@ -100,9 +190,11 @@ class MessageInterceptor:
             logger: Optional logger for debugging
         """
         self.logger = logger or self._default_logger()
-        self._active_tasks: List[asyncio.Task] = []
+        # Messages discarded because a collector's queue was full
+        # (cumulative across streams, for observability)
+        self.dropped_messages = 0
 
-    async def intercept(
+    def intercept(
         self,
         query_iterator: AsyncIterator[Any],
         collectors: List[MessageCollector]
@@ -110,16 +202,18 @@ class MessageInterceptor:
         """
         Intercept SDK query messages while maintaining streaming behavior
 
-        Key Insight (from architecture doc):
-            Use asyncio.create_task() to process messages in parallel
-            with yielding them, avoiding any blocking.
+        Returns a thin __anext__-based iterator rather than an async
+        generator: each message costs one source __anext__ plus a
+        synchronous queue fan-out, with no extra generator frame in
+        between.
 
         Args:
             query_iterator: AsyncIterator from SDK query()
             collectors: List of MessageCollector instances
 
-        Yields:
-            Messages from query_iterator (unchanged, zero latency)
+        Returns:
+            AsyncIterator yielding messages from query_iterator
+            (unchanged, zero latency)
 
         Example:
             query_iter = query(prompt, options)
@@ -130,39 +224,98 @@ class MessageInterceptor:
                 # collectors processing in background
                 print(msg)
         """
-        message_count = 0
-        error_occurred: Optional[Exception] = None
+        # Fast path: nothing to collect, so hand back the source iterator
+        # itself - not even a pass-through wrapper
+        if not collectors:
+            return query_iterator.__aiter__()
 
-        try:
-            async for msg in query_iterator:
-                message_count += 1
+        return _InterceptIter(self, query_iterator, collectors)
 
-                # Non-blocking: Fire collectors in background
-                for collector in collectors:
-                    # Create task for each collector
-                    # Tasks run in parallel, don't block message yielding
-                    task = asyncio.create_task(
-                        self._safe_process(collector, msg, message_count)
-                    )
-                    self._active_tasks.append(task)
+    def _offer(
+        self,
+        queue: asyncio.Queue,
+        item: Any,
+        pool: _MessagePool
+    ) -> None:
+        """
+        put_nowait with drop-oldest overflow policy
+
+        If the queue is full, the oldest pending envelope is discarded
+        (and recycled) to make room, so a slow collector loses its most
+        stale messages while the producer never awaits.
 
-                # Yield immediately - zero latency added
-                yield msg
+        Args:
+            queue: Collector queue to offer into
+            item: Envelope or end-of-stream sentinel
+            pool: Pool to recycle a dropped envelope into
+        """
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            try:
+                dropped = queue.get_nowait()
+                if dropped is not _STREAM_END:
+                    pool.release(dropped)
+                self.dropped_messages += 1
+            except asyncio.QueueEmpty:
+                pass
+            queue.put_nowait(item)
+
+    async def _drain(
+        self,
+        collector: MessageCollector,
+        queue: asyncio.Queue,
+        pool: _MessagePool
+    ) -> None:
+        """
+        Long-lived worker: feed one collector from its queue
 
-            self.logger.debug(f"Stream complete: {message_count} messages processed")
+        Runs for the lifetime of the stream, consuming envelopes until
+        the end-of-stream sentinel arrives. When the queue has a backlog
+        the worker drains up to BATCH_SIZE envelopes and delivers them
+        in one process_many() call instead of one coroutine round-trip
+        per message. Envelopes are returned to the pool after delivery.
 
-        except Exception as e:
-            error_occurred = e
-            self.logger.error(f"Stream error after {message_count} messages: {e}")
-            raise
+        Args:
+            collector: Collector this worker feeds
+            queue: Queue the producer fills via put_nowait
+            pool: Pool to return envelopes to after processing
+        """
+        # Bind once per stream: saves an attribute lookup per message in
+        # the loop below
+        collector_name = collector.__class__.__name__
+        process = collector.process
+        process_many = collector.process_many
+        batch_size = self.BATCH_SIZE
+
+        stream_ended = False
+        while not stream_ended:
+            env = await queue.get()
+            if env is _STREAM_END:
+                break
+
+            # Opportunistic batch: take whatever is already queued
+            batch = [env]
+            while len(batch) < batch_size and not queue.empty():
+                nxt = queue.get_nowait()
+                if nxt is _STREAM_END:
+                    stream_ended = True
+                    break
+                batch.append(nxt)
 
-        finally:
-            # Wait for all collector tasks to complete
-            await self._finalize_collectors(collectors, error_occurred)
+            try:
+                if len(batch) == 1:
+                    await self._safe_process(collector_name, process, env.msg, env.seq)
+                else:
+                    await self._safe_process_many(collector_name, process_many, batch)
+            finally:
+                for item in batch:
+                    pool.release(item)
 
     async def _safe_process(
         self,
-        collector: MessageCollector,
+        collector_name: str,
+        process: Any,
         message: Any,
         message_number: int
     ) -> None:
@@ -175,14 +328,13 @@ class MessageInterceptor:
         3. Overall operation
 
         Args:
-            collector: Collector instance
+            collector_name: Collector class name for log messages
+            process: Collector's bound process method
             message: SDK message to process
             message_number: Sequential message number for debugging
         """
-        collector_name = collector.__class__.__name__
-
         try:
-            await collector.process(message)
+            await process(message)
 
         except asyncio.CancelledError:
             # Task was cancelled (normal during cleanup)
@@ -197,36 +349,77 @@ class MessageInterceptor:
                 exc_info=True
             )
 
+    async def _safe_process_many(
+        self,
+        collector_name: str,
+        process_many: Any,
+        envelopes: List[_Envelope]
+    ) -> None:
+        """
+        Safely deliver a batch with the same error isolation as
+        _safe_process
+
+        Args:
+            collector_name: Collector class name for log messages
+            process_many: Collector's bound process_many method
+            envelopes: Batch of pooled envelopes in arrival order
+        """
+        first, last = envelopes[0].seq, envelopes[-1].seq
+
+        try:
+            await process_many([env.msg for env in envelopes])
+
+        except asyncio.CancelledError:
+            self.logger.debug(
+                f"{collector_name}: Task cancelled in batch {first}-{last}"
+            )
+
+        except Exception as e:
+            self.logger.error(
+                f"{collector_name}: Error processing messages {first}-{last}: {e}",
+                exc_info=True
+            )
+
     async def _finalize_collectors(
         self,
         collectors: List[MessageCollector],
-        error: Optional[Exception]
+        workers: List[asyncio.Task],
+        error: Optional[BaseException]
     ) -> None:
         """
         Finalize all collectors after stream completes or errors
 
         Args:
             collectors: List of collectors to finalize
+            workers: Per-collector worker tasks for this stream
             error: Exception if stream errored, None if completed normally
         """
-        # Wait for all active tasks to complete
-        if self._active_tasks:
-            self.logger.debug(f"Waiting for {len(self._active_tasks)} collector tasks")
+        # Wait for this stream's worker tasks to complete
+        if workers:
+            self.logger.debug(f"Waiting for {len(workers)} collector tasks")
 
-            # Give tasks reasonable time to complete
+            # Give tasks reasonable time to complete; one gather with
+            # return_exceptions collects every worker outcome so a failed
+            # worker neither aborts the flush nor goes unreported
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*self._active_tasks, return_exceptions=True),
+                results = await asyncio.wait_for(
+                    asyncio.gather(*workers, return_exceptions=True),
                     timeout=5.0
                 )
+                for collector, result in zip(collectors, results):
+                    if isinstance(result, asyncio.CancelledError):
+                        # Expected on early termination - not a failure
+                        continue
+                    if isinstance(result, BaseException):
+                        self.logger.error(
+                            f"{collector.__class__.__name__}: Worker failed: {result}"
+                        )
             except asyncio.TimeoutError:
                 self.logger.warning("Collector tasks timeout - cancelling remaining tasks")
-                for task in self._active_tasks:
+                for task in workers:
                     if not task.done():
                         task.cancel()
 
-            self._active_tasks.clear()
-
         # Call appropriate lifecycle method on each collector
         for collector in collectors:
             collector_name = collector.__class__.__name__
@@ -258,6 +451,160 @@ class MessageInterceptor:
         return logger
 
 
+class _InterceptIter:
+    """
+    Iterator returned by MessageInterceptor.intercept
+
+    Implements __anext__ directly so there is no async-generator state
+    machine between the caller and the source: pull one message, fan it
+    out with put_nowait, hand it back. Worker tasks are started lazily
+    on the first __anext__ (a running loop is guaranteed there) and
+    finalized when the source is exhausted, raises, or aclose() is
+    called.
+    """
+
+    __slots__ = ('_interceptor', '_source', '_collectors', '_queues',
+                 '_workers', '_pool', '_loop', '_count', '_finalized')
+
+    def __init__(
+        self,
+        interceptor: MessageInterceptor,
+        source: AsyncIterator[Any],
+        collectors: List[MessageCollector]
+    ):
+        self._interceptor = interceptor
+        self._source = source.__aiter__()
+        self._collectors = collectors
+        self._queues: Optional[List[asyncio.Queue]] = None
+        self._workers: Optional[List[asyncio.Task]] = None
+        self._pool: Optional[_MessagePool] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._count = 0
+        self._finalized = False
+
+    def __aiter__(self) -> "_InterceptIter":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._workers is None:
+            self._start()
+
+        try:
+            msg = await self._source.__anext__()
+        except StopAsyncIteration:
+            self._interceptor.logger.debug(
+                f"Stream complete: {self._count} messages processed"
+            )
+            await self._finish(None)
+            raise
+        except Exception as e:
+            self._interceptor.logger.error(
+                f"Stream error after {self._count} messages: {e}"
+            )
+            await self._finish(e)
+            raise
+        except BaseException as e:
+            # CancelledError (Ctrl-C) and friends must finalize too: the
+            # workers are long-lived tasks that would otherwise leak and
+            # the lifecycle hooks would never run
+            self._interceptor.logger.debug(
+                f"Stream interrupted after {self._count} messages: {e!r}"
+            )
+            await self._finish(e, cancel=True)
+            raise
+
+        self._count += 1
+
+        # Synchronous fan-out: hand the message to each collector's worker
+        interceptor = self._interceptor
+        pool = self._pool
+        ts = self._loop.time()
+        for queue in self._queues:
+            env = pool.acquire()
+            env.msg = msg
+            env.seq = self._count
+            env.ts = ts
+            interceptor._offer(queue, env, pool)
+
+        return msg
+
+    def _start(self) -> None:
+        """Create pool, queues and one long-lived worker per collector"""
+        interceptor = self._interceptor
+        self._loop = asyncio.get_running_loop()
+
+        # Shared envelope pool: filled by __anext__, drained by workers.
+        # Keeps per-message work allocation-free once the pool is warm.
+        self._pool = _MessagePool(interceptor.POOL_SIZE)
+
+        # One worker per collector for the whole stream: the producer only
+        # does put_nowait (never awaits), so task creation cost is paid
+        # once per stream, not per message
+        self._queues = [
+            asyncio.Queue(maxsize=interceptor.QUEUE_CAPACITY)
+            for _ in self._collectors
+        ]
+        self._workers = [
+            asyncio.create_task(interceptor._drain(collector, queue, self._pool))
+            for collector, queue in zip(self._collectors, self._queues)
+        ]
+
+    async def _finish(
+        self,
+        error: Optional[BaseException],
+        cancel: bool = False
+    ) -> None:
+        """Signal end of stream, drain workers, run lifecycle hooks"""
+        if self._finalized:
+            return
+        self._finalized = True
+
+        if self._workers is None:
+            # Never iterated: collectors saw nothing, still run lifecycle
+            await self._interceptor._finalize_collectors(
+                self._collectors, [], error
+            )
+            return
+
+        if cancel:
+            # Early termination: pending queued messages are no longer
+            # needed, so cancel the workers instead of draining them
+            for worker in self._workers:
+                worker.cancel()
+        else:
+            for queue in self._queues:
+                self._interceptor._offer(queue, _STREAM_END, self._pool)
+        await self._interceptor._finalize_collectors(
+            self._collectors, self._workers, error
+        )
+
+    async def aclose(self) -> None:
+        """Close the source and finalize collectors (early termination)"""
+        await self._finish(None, cancel=True)
+        aclose = getattr(self._source, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+
+
+# Process-wide default interceptor. All stream state in intercept() is
+# local to each call, so one instance can serve every caller; sharing it
+# amortizes construction and keeps drop accounting in one place.
+_default_interceptor: Optional[MessageInterceptor] = None
+
+
+def get_default_interceptor() -> MessageInterceptor:
+    """
+    Get the process-wide MessageInterceptor instance
+
+    Returns:
+        Lazily-created shared interceptor
+    """
+    global _default_interceptor
+    if _default_interceptor is None:
+        _default_interceptor = MessageInterceptor()
+    return _default_interceptor
+
+
 class TransparentAsyncWrapper:
     """
     Convenience wrapper for common interceptor usage patterns
@@ -282,10 +629,14 @@ class TransparentAsyncWrapper:
 
         Args:
             collectors: List of collectors to use for all wrapped iterators
-            logger: Optional logger
+            logger: Optional logger (uses the shared default interceptor
+                when omitted)
         """
         self.collectors = collectors
-        self.interceptor = MessageInterceptor(logger=logger)
+        if logger is None:
+            self.interceptor = get_default_interceptor()
+        else:
+            self.interceptor = MessageInterceptor(logger=logger)
 
     async def wrap(self, query_iterator: AsyncIterator[Any]) -> AsyncIterator[Any]:
         """
@@ -310,24 +661,31 @@ class DebugCollector(MessageCollector):
     Useful for development and testing.
     """
 
+    __slots__ = ('logger', 'message_count', '_next_count', 'start_time')
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.message_count = 0
-        self.start_time: Optional[datetime] = None
+        # C-level counter: one __next__ call per message instead of the
+        # load/add/store bytecode sequence of `self.message_count += 1`
+        self._next_count = itertools.count(1).__next__
+        # Monotonic float: cheap to record per message, immune to clock
+        # adjustments, and allocates no datetime object graph
+        self.start_time: Optional[float] = None
 
     async def process(self, message: Any) -> None:
         """Log message type and count"""
         if self.start_time is None:
-            self.start_time = datetime.now()
+            self.start_time = time.monotonic()
 
-        self.message_count += 1
+        self.message_count = self._next_count()
         msg_type = type(message).__name__
         self.logger.debug(f"Message {self.message_count}: {msg_type}")
 
     async def on_stream_complete(self) -> None:
         """Log completion statistics"""
         if self.start_time:
-            duration = (datetime.now() - self.start_time).total_seconds()
+            duration = time.monotonic() - self.start_time
             self.logger.info(
                 f"Stream complete: {self.message_count} messages in {duration:.2f}s"
             )
@@ -344,6 +702,8 @@ class BufferingCollector(MessageCollector):
     Useful for testing and post-processing analysis.
     """
 
+    __slots__ = ('_messages', 'max_messages', 'overflow_count')
+
     def __init__(self, max_messages: int = 1000):
         """
         Initialize buffering collector
@@ -351,14 +711,16 @@ class BufferingCollector(MessageCollector):
         Args:
             max_messages: Maximum messages to buffer (prevents unbounded growth)
         """
-        self.messages: List[Any] = []
+        # deque appends in O(1) without the geometric array reallocation
+        # a list pays as it grows; materialized only on get_messages()
+        self._messages: deque = deque()
         self.max_messages = max_messages
         self.overflow_count = 0
 
     async def process(self, message: Any) -> None:
         """Buffer message if space available"""
-        if len(self.messages) < self.max_messages:
-            self.messages.append(message)
+        if len(self._messages) < self.max_messages:
+            self._messages.append(message)
         else:
             self.overflow_count += 1
 
@@ -370,6 +732,10 @@ class BufferingCollector(MessageCollector):
         """Stream errored"""
         pass
 
+    def __len__(self) -> int:
+        """Number of buffered messages (no materialization needed)"""
+        return len(self._messages)
+
     def get_messages(self) -> List[Any]:
         """
         Get buffered messages
@@ -377,9 +743,9 @@ class BufferingCollector(MessageCollector):
         Returns:
             List of buffered messages
         """
-        return self.messages.copy()
+        return list(self._messages)
 
     def clear(self) -> None:
         """Clear buffer"""
-        self.messages.clear()
+        self._messages.clear()
         self.overflow_count = 0
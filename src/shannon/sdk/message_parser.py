@@ -43,6 +43,96 @@ except ImportError:
     ToolUseBlock = Any
 
 
+
+# Precompiled patterns: the extract_* entry points run once per message
+# stream (and extract_progress_indicators once per message), so compiling
+# at import keeps sre setup out of every call. Patterns built from
+# runtime values (dimension/domain names, list headers) stay dynamic.
+_SKILL_RE = re.compile(r"(?:Using|Invoking)\s+skill:\s*(\S+)")
+_COMPLEXITY_RE = re.compile(r"Complexity[:\s]+(\d+\.\d+)", re.IGNORECASE)
+_MCP_RE = re.compile(r"Tier\s+(\d+):\s*(\S+)\s*[-\u2013]\s*([^\n]+)")
+_PHASE_RE = re.compile(
+    r"(?:^|\n)(?:##\s*)?Phase\s+(\d+):\s*([^\n]+)", re.IGNORECASE | re.MULTILINE
+)
+_PERCENT_RE = re.compile(r"(\d+)%")
+_DURATION_EST_RE = re.compile(r"(?:Duration|Timeline):\s*([^\n]+)")
+_NEXT_SECTION_RE = re.compile(r"\n(?:#{1,3}\s|\*\*[A-Z])")
+_BULLET_ITEM_RE = re.compile(r"^[-*\u2022]\s+")
+_NUMBERED_ITEM_RE = re.compile(r"^\d+\.\s+")
+_ITEM_PREFIX_RE = re.compile(r"^[-*\u2022\d.]+\s+")
+_WAVE_BASED_RE = re.compile(r"wave[-\s]based", re.IGNORECASE)
+_SEQUENTIAL_RE = re.compile(r"sequential", re.IGNORECASE)
+_TIMELINE_RE = re.compile(r"(?:Timeline|Duration|Estimate):\s*([^\n]+)", re.IGNORECASE)
+_TIME_RANGE_RE = re.compile(r"(\d+[-\u2013]\d+)\s+(day|week|month)s?")
+_WAVE_NUMBER_RE = re.compile(r"Wave\s+(\d+)", re.IGNORECASE)
+_WAVE_NAME_RE = re.compile(r"Wave\s+\d+:\s*([^\n]+)", re.IGNORECASE)
+_AGENTS_DEPLOYED_RE = re.compile(r"(\d+)\s+agent[s]?\s+deployed", re.IGNORECASE)
+_MINUTES_RE = re.compile(r"(\d+(?:\.\d+)?)\s+minute[s]?", re.IGNORECASE)
+_HOURS_RE = re.compile(r"(\d+(?:\.\d+)?)\s+hour[s]?", re.IGNORECASE)
+_FILE_PATH_RE = re.compile(r"[\w/.-]+\.(?:py|md|json|toml|yaml|yml|txt)")
+_TESTS_COUNT_RE = re.compile(r"(\d+)\s+test[s]?", re.IGNORECASE)
+_NO_MOCKS_RE = re.compile(r"no\s+mocks", re.IGNORECASE)
+_MOCKS_USED_RE = re.compile(r"mock[s]?\s+(?:used|created)", re.IGNORECASE)
+_COVERAGE_INT_RE = re.compile(r"(\d+)%\s+coverage", re.IGNORECASE)
+_COVERAGE_FLOAT_RE = re.compile(r"(\d+(?:\.\d+)?)%\s+coverage", re.IGNORECASE)
+_TYPE_HINTS_RE = re.compile(r"type\s+hint[s]?", re.IGNORECASE)
+_DOCSTRINGS_RE = re.compile(r"docstring[s]?", re.IGNORECASE)
+_TOTAL_TESTS_RE = re.compile(r"(\d+)\s+total\s+test[s]?", re.IGNORECASE)
+_TESTS_RUN_RE = re.compile(r"(\d+)\s+test[s]?\s+(?:run|executed)", re.IGNORECASE)
+_TESTS_PASSED_RE = re.compile(r"(\d+)\s+(?:test[s]?\s+)?passed", re.IGNORECASE)
+_TESTS_FAILED_RE = re.compile(r"(\d+)\s+(?:test[s]?\s+)?failed", re.IGNORECASE)
+_ALL_PASSED_RE = re.compile(r"all\s+tests?\s+passed", re.IGNORECASE)
+_ZERO_FAILED_RE = re.compile(r"0\s+(?:test[s]?\s+)?failed", re.IGNORECASE)
+_ANY_FAILED_RE = re.compile(r"test[s]?\s+failed", re.IGNORECASE)
+_TEST_DETAIL_RE = re.compile(r"(?:PASS|FAIL):\s*([^\n]+)")
+_GAP_RES = [
+    re.compile(r"Gap:\s*([^\n]+)", re.IGNORECASE),
+    re.compile(r"Missing:\s*([^\n]+)", re.IGNORECASE),
+    re.compile(r"TODO:\s*([^\n]+)", re.IGNORECASE),
+    re.compile(r"\u26a0\s*([^\n]+)", re.IGNORECASE),
+]
+_PERCENT_COMPLETE_RE = re.compile(r"(\d+(?:\.\d+)?)%\s+complete", re.IGNORECASE)
+_COMPLETENESS_RE = re.compile(r"completeness:\s*(\d+(?:\.\d+)?)%", re.IGNORECASE)
+_CRITICAL_RES = [
+    re.compile(r"Critical:\s*([^\n]+)", re.IGNORECASE),
+    re.compile(r"Security:\s*([^\n]+)", re.IGNORECASE),
+    re.compile(r"Blocker:\s*([^\n]+)", re.IGNORECASE),
+]
+_SUMMARY_RE = re.compile(r"Summary:\s*([^\n]+(?:\n(?!\n)[^\n]+)*)", re.IGNORECASE)
+
+# Dimension and domain vocabularies are fixed, so both tables are parsed
+# with one alternation scan over the text instead of one search per name.
+_DIMENSION_NAMES = (
+    "structural",
+    "cognitive",
+    "coordination",
+    "temporal",
+    "technical",
+    "scale",
+    "uncertainty",
+    "dependencies",
+)
+# Matches: "Structural: 0.55", "- Structural: 0.55", "| Structural | 0.55 |"
+_DIMENSIONS_RE = re.compile(
+    rf"[-|]?\s*({'|'.join(_DIMENSION_NAMES)})[\s|:]+(\d+\.\d+)", re.IGNORECASE
+)
+_DOMAIN_NAMES = (
+    "Frontend",
+    "Backend",
+    "Infrastructure",
+    "Data",
+    "DevOps",
+    "Testing",
+    "Documentation",
+    "Configuration",
+    "Security",
+    "API",
+)
+_DOMAIN_CANONICAL = {name.lower(): name for name in _DOMAIN_NAMES}
+# Matches: "Frontend: 30%" or "| Frontend | 30% |"
+_DOMAINS_RE = re.compile(rf"({'|'.join(_DOMAIN_NAMES)})[\s|:]+(\d+)%", re.IGNORECASE)
+
+
 class MessageParser:
     """
     Extract structured data from SDK message streams.
@@ -193,7 +283,7 @@ class MessageParser:
                         return {"type": "progress", "step": text.strip()}
 
                     # Detect skill invocation
-                    skill_match = re.search(r"(?:Using|Invoking)\s+skill:\s*(\S+)", text)
+                    skill_match = _SKILL_RE.search(text)
                     if skill_match:
                         return {
                             "type": "skill",
@@ -215,7 +305,7 @@ class MessageParser:
                         return {"type": "progress", "step": text.strip()}
 
                     # Detect skill invocation
-                    skill_match = re.search(r"(?:Using|Invoking)\s+skill:\s*(\S+)", text)
+                    skill_match = _SKILL_RE.search(text)
                     if skill_match:
                         return {
                             "type": "skill",
@@ -231,68 +321,71 @@ class MessageParser:
 
     def _collect_assistant_text(self, messages: List) -> str:
         """Collect all text from AssistantMessage and ResultMessage blocks."""
-        result_text = ""
+        # Accumulate into a list and join once: += on str re-copies the
+        # whole buffer on every block, which is quadratic in stream length
+        parts: List[str] = []
+        append = parts.append
 
         for msg in messages:
             # Handle SystemMessage (has 'data' attribute)
             if SDK_AVAILABLE and isinstance(msg, SystemMessage):
                 if hasattr(msg, "data") and msg.data:
                     if isinstance(msg.data, str):
-                        result_text += msg.data + "\n"
+                        append(msg.data)
                     elif isinstance(msg.data, dict) and "text" in msg.data:
-                        result_text += msg.data["text"] + "\n"
+                        append(msg.data["text"])
             # Handle ResultMessage (has 'result' attribute)
             elif SDK_AVAILABLE and isinstance(msg, ResultMessage):
                 if hasattr(msg, "result") and msg.result is not None:
                     if isinstance(msg.result, str):
-                        result_text += msg.result + "\n"
+                        append(msg.result)
                     elif isinstance(msg.result, list):
                         for item in msg.result:
                             if hasattr(item, "text"):
-                                result_text += item.text + "\n"
+                                append(item.text)
                             elif isinstance(item, dict) and "text" in item:
-                                result_text += item["text"] + "\n"
+                                append(item["text"])
                             elif isinstance(item, str):
-                                result_text += item + "\n"
+                                append(item)
                     elif isinstance(msg.result, dict):
                         # Result might be a dict with output data
                         if "output" in msg.result:
-                            result_text += str(msg.result["output"]) + "\n"
+                            append(str(msg.result["output"]))
                         elif "text" in msg.result:
-                            result_text += msg.result["text"] + "\n"
+                            append(msg.result["text"])
             # Handle TextBlock directly (from streaming)
             elif SDK_AVAILABLE and isinstance(msg, TextBlock):
-                result_text += msg.text + "\n"
+                append(msg.text)
             # Handle AssistantMessage
             elif SDK_AVAILABLE and isinstance(msg, AssistantMessage):
                 for block in msg.content:
                     if isinstance(block, TextBlock):
-                        result_text += block.text + "\n"
+                        append(block.text)
             # Fallback for testing without SDK
             elif hasattr(msg, "content"):
                 if isinstance(msg.content, str):
-                    result_text += msg.content + "\n"
+                    append(msg.content)
                 elif isinstance(msg.content, list):
                     for block in msg.content:
                         if hasattr(block, "text"):
-                            result_text += block.text + "\n"
+                            append(block.text)
             # Additional fallback: check for output attribute
             elif hasattr(msg, "output"):
                 if isinstance(msg.output, str):
-                    result_text += msg.output + "\n"
+                    append(msg.output)
                 elif isinstance(msg.output, list):
                     for block in msg.output:
                         if hasattr(block, "text"):
-                            result_text += block.text + "\n"
+                            append(block.text)
             # Handle plain text attributes
             elif hasattr(msg, "text"):
-                result_text += msg.text + "\n"
+                append(msg.text)
 
-        return result_text
+        return "\n".join(parts) + "\n" if parts else ""
 
     def _parse_complexity_score(self, text: str) -> float:
         """Parse complexity score from text like 'Complexity: 0.68 (COMPLEX)'."""
-        match = re.search(r"Complexity[:\s]+(\d+\.\d+)", text, re.IGNORECASE)
+        match = _COMPLEXITY_RE.search(text)
         if not match:
             raise ValueError("Could not find complexity score in analysis output")
 
@@ -331,36 +424,26 @@ class MessageParser:
         """Parse dimension scores from markdown table or text."""
         dimensions = {}
 
-        # Pattern matches: "Structural: 0.55", "- Structural: 0.55", or table rows like "| Structural | 0.55 |"
-        for dim_name in [
-            "structural",
-            "cognitive",
-            "coordination",
-            "temporal",
-            "technical",
-            "scale",
-            "uncertainty",
-            "dependencies",
-        ]:
-            # Case-insensitive search for dimension with flexible formatting
-            # Matches: "Structural: 0.55", "- Structural: 0.55", "| Structural | 0.55 |"
-            pattern = rf"[-|]?\s*{dim_name}[\s|:]+(\d+\.\d+)"
-            match = re.search(pattern, text, re.IGNORECASE)
-
-            if match:
-                score = float(match.group(1))
-                weight = self.dimension_weights[dim_name]
-                contribution = score * weight
-
-                # Create DimensionScore and convert to dict
-                dim_score = DimensionScore(
-                    dimension=dim_name,
-                    score=score,
-                    weight=weight,
-                    contribution=contribution,
-                    details={},
-                )
-                dimensions[dim_name] = dim_score.model_dump()
+        # Single pass over the text; first occurrence wins per dimension,
+        # matching the previous one-search-per-name behavior
+        for match in _DIMENSIONS_RE.finditer(text):
+            dim_name = match.group(1).lower()
+            if dim_name in dimensions:
+                continue
+
+            score = float(match.group(2))
+            weight = self.dimension_weights[dim_name]
+            contribution = score * weight
+
+            # Create DimensionScore and convert to dict
+            dim_score = DimensionScore(
+                dimension=dim_name,
+                score=score,
+                weight=weight,
+                contribution=contribution,
+                details={},
+            )
+            dimensions[dim_name] = dim_score.model_dump()
 
         # Validate we have all 8 dimensions (or at least 6 for partial results)
         if len(dimensions) < 6:
@@ -376,27 +459,11 @@ class MessageParser:
         """Parse domain percentages from text."""
         domains = {}
 
-        # Common domain patterns
-        domain_names = [
-            "Frontend",
-            "Backend",
-            "Infrastructure",
-            "Data",
-            "DevOps",
-            "Testing",
-            "Documentation",
-            "Configuration",
-            "Security",
-            "API",
-        ]
-
-        # Pattern: "Frontend: 30%" or "| Frontend | 30% |"
-        for domain in domain_names:
-            pattern = rf"{domain}[\s|:]+(\d+)%"
-            match = re.search(pattern, text, re.IGNORECASE)
-
-            if match:
-                domains[domain] = int(match.group(1))
+        # Single pass over the text; first occurrence wins per domain
+        for match in _DOMAINS_RE.finditer(text):
+            domain = _DOMAIN_CANONICAL[match.group(1).lower()]
+            if domain not in domains:
+                domains[domain] = int(match.group(2))
 
         # Validate total is 100%
         total = sum(domains.values())
@@ -418,11 +485,8 @@ class MessageParser:
         """Parse MCP recommendations from text."""
         mcps = []
 
-        # Pattern for MCP recommendations
         # Looking for: "Tier 1: serena - Code analysis" or similar
-        mcp_pattern = r"Tier\s+(\d+):\s*(\S+)\s*[-–]\s*([^\n]+)"
-
-        for match in re.finditer(mcp_pattern, text):
+        for match in _MCP_RE.finditer(text):
             tier = int(match.group(1))
             name = match.group(2).strip()
             purpose = match.group(3).strip()
@@ -449,9 +513,7 @@ class MessageParser:
 
         # Look for phase headers like "Phase 1: Foundation" or "## Phase 1: Foundation"
         # BUT exclude lines that look like examples or documentation
-        phase_pattern = r"(?:^|\n)(?:##\s*)?Phase\s+(\d+):\s*([^\n]+)"
-
-        all_matches = list(re.finditer(phase_pattern, text, re.IGNORECASE | re.MULTILINE))
+        all_matches = list(_PHASE_RE.finditer(text))
 
         # Filter out documentation/examples - only keep phases 1-5 in sequence near each other
         if all_matches:
@@ -493,14 +555,12 @@ class MessageParser:
             )
 
             # Parse duration
-            duration_match = re.search(r"(\d+)%", phase_content)
+            duration_match = _PERCENT_RE.search(phase_content)
             duration_percent = (
                 int(duration_match.group(1)) if duration_match else 20
             )  # Default 20%
 
-            duration_est_match = re.search(
-                r"(?:Duration|Timeline):\s*([^\n]+)", phase_content
-            )
+            duration_est_match = _DURATION_EST_RE.search(phase_content)
             duration_estimate = (
                 duration_est_match.group(1).strip()
                 if duration_est_match
@@ -538,7 +598,7 @@ class MessageParser:
         # Extract text after header
         content_start = match.end()
         # Find next header or section break
-        next_section = re.search(r"\n(?:#{1,3}\s|\*\*[A-Z])", text[content_start:])
+        next_section = _NEXT_SECTION_RE.search(text[content_start:])
         content_end = (
             content_start + next_section.start() if next_section else len(text)
         )
@@ -547,9 +607,9 @@ class MessageParser:
         # Extract list items (-, *, 1., etc.)
         for line in content.split("\n"):
             line = line.strip()
-            if re.match(r"^[-*•]\s+", line) or re.match(r"^\d+\.\s+", line):
+            if _BULLET_ITEM_RE.match(line) or _NUMBERED_ITEM_RE.match(line):
                 # Remove bullet/number prefix
-                item = re.sub(r"^[-*•\d.]+\s+", "", line).strip()
+                item = _ITEM_PREFIX_RE.sub("", line).strip()
                 if item:
                     items.append(item)
 
@@ -557,9 +617,9 @@ class MessageParser:
 
     def _parse_execution_strategy(self, text: str) -> str:
         """Parse execution strategy (sequential or wave-based)."""
-        if re.search(r"wave[-\s]based", text, re.IGNORECASE):
+        if _WAVE_BASED_RE.search(text):
             return "wave-based"
-        elif re.search(r"sequential", text, re.IGNORECASE):
+        elif _SEQUENTIAL_RE.search(text):
             return "sequential"
         else:
             # Default based on complexity
@@ -568,15 +628,13 @@ class MessageParser:
     def _parse_timeline(self, text: str) -> str:
         """Parse human-readable timeline estimate."""
         # Look for patterns like "2-4 days", "1-2 weeks", "3 weeks"
-        timeline_match = re.search(
-            r"(?:Timeline|Duration|Estimate):\s*([^\n]+)", text, re.IGNORECASE
-        )
+        timeline_match = _TIMELINE_RE.search(text)
 
         if timeline_match:
             return timeline_match.group(1).strip()
 
         # Look for bare time estimates
-        time_match = re.search(r"(\d+[-–]\d+)\s+(day|week|month)s?", text)
+        time_match = _TIME_RANGE_RE.search(text)
         if time_match:
             return f"{time_match.group(1)} {time_match.group(2)}s"
 
@@ -588,27 +646,27 @@ class MessageParser:
 
     def _parse_wave_number(self, text: str) -> int:
         """Parse wave number from result text."""
-        match = re.search(r"Wave\s+(\d+)", text, re.IGNORECASE)
+        match = _WAVE_NUMBER_RE.search(text)
         return int(match.group(1)) if match else 1
 
     def _parse_wave_name(self, text: str) -> str:
         """Parse wave name from result text."""
-        match = re.search(r"Wave\s+\d+:\s*([^\n]+)", text, re.IGNORECASE)
+        match = _WAVE_NAME_RE.search(text)
         return match.group(1).strip() if match else "Unknown Wave"
 
     def _parse_agents_deployed(self, text: str) -> int:
         """Parse number of agents deployed."""
-        match = re.search(r"(\d+)\s+agent[s]?\s+deployed", text, re.IGNORECASE)
+        match = _AGENTS_DEPLOYED_RE.search(text)
         return int(match.group(1)) if match else 1
 
     def _parse_execution_time(self, text: str) -> float:
         """Parse execution time in minutes."""
         # Look for patterns like "45 minutes", "1.5 hours"
-        minutes_match = re.search(r"(\d+(?:\.\d+)?)\s+minute[s]?", text, re.IGNORECASE)
+        minutes_match = _MINUTES_RE.search(text)
         if minutes_match:
             return float(minutes_match.group(1))
 
-        hours_match = re.search(r"(\d+(?:\.\d+)?)\s+hour[s]?", text, re.IGNORECASE)
+        hours_match = _HOURS_RE.search(text)
         if hours_match:
             return float(hours_match.group(1)) * 60
 
@@ -618,9 +676,7 @@ class MessageParser:
         """Parse list of files created."""
         files = []
         # Look for file patterns (paths or names with extensions)
-        file_pattern = r"[\w/.-]+\.(?:py|md|json|toml|yaml|yml|txt)"
-
-        for match in re.finditer(file_pattern, text):
+        for match in _FILE_PATH_RE.finditer(text):
             file_path = match.group(0)
             if file_path not in files:
                 files.append(file_path)
@@ -640,15 +696,15 @@ class MessageParser:
 
     def _parse_tests_created(self, text: str) -> int:
         """Parse number of tests created."""
-        match = re.search(r"(\d+)\s+test[s]?", text, re.IGNORECASE)
+        match = _TESTS_COUNT_RE.search(text)
         return int(match.group(1)) if match else 0
 
     def _parse_no_mocks_confirmation(self, text: str) -> bool:
         """Check for NO MOCKS confirmation."""
         # Look for explicit confirmation or absence of mocks
-        if re.search(r"no\s+mocks", text, re.IGNORECASE):
+        if _NO_MOCKS_RE.search(text):
             return True
-        if re.search(r"mock[s]?\s+(?:used|created)", text, re.IGNORECASE):
+        if _MOCKS_USED_RE.search(text):
             return False
         return True  # Default to True (optimistic)
 
@@ -657,16 +713,16 @@ class MessageParser:
         metrics = {}
 
         # Coverage percentage
-        coverage_match = re.search(r"(\d+)%\s+coverage", text, re.IGNORECASE)
+        coverage_match = _COVERAGE_INT_RE.search(text)
         if coverage_match:
             metrics["coverage"] = int(coverage_match.group(1))
 
         # Type hints
-        if re.search(r"type\s+hint[s]?", text, re.IGNORECASE):
+        if _TYPE_HINTS_RE.search(text):
             metrics["type_hints"] = True
 
         # Docstrings
-        if re.search(r"docstring[s]?", text, re.IGNORECASE):
+        if _DOCSTRINGS_RE.search(text):
             metrics["docstrings"] = True
 
         return metrics
@@ -706,12 +762,12 @@ class MessageParser:
 
     def _parse_total_tests(self, text: str) -> int:
         """Parse total number of tests."""
-        match = re.search(r"(\d+)\s+total\s+test[s]?", text, re.IGNORECASE)
+        match = _TOTAL_TESTS_RE.search(text)
         if match:
             return int(match.group(1))
 
         # Try alternative patterns
-        match = re.search(r"(\d+)\s+test[s]?\s+(?:run|executed)", text, re.IGNORECASE)
+        match = _TESTS_RUN_RE.search(text)
         if match:
             return int(match.group(1))
 
@@ -719,24 +775,24 @@ class MessageParser:
 
     def _parse_tests_passed(self, text: str) -> int:
         """Parse number of tests passed."""
-        match = re.search(r"(\d+)\s+(?:test[s]?\s+)?passed", text, re.IGNORECASE)
+        match = _TESTS_PASSED_RE.search(text)
         return int(match.group(1)) if match else 0
 
     def _parse_tests_failed(self, text: str) -> int:
         """Parse number of tests failed."""
-        match = re.search(r"(\d+)\s+(?:test[s]?\s+)?failed", text, re.IGNORECASE)
+        match = _TESTS_FAILED_RE.search(text)
         return int(match.group(1)) if match else 0
 
     def _parse_all_tests_passed(self, text: str) -> bool:
         """Determine if all tests passed."""
         # Check for explicit success indicators
-        if re.search(r"all\s+tests?\s+passed", text, re.IGNORECASE):
+        if _ALL_PASSED_RE.search(text):
             return True
-        if re.search(r"0\s+(?:test[s]?\s+)?failed", text, re.IGNORECASE):
+        if _ZERO_FAILED_RE.search(text):
             return True
 
         # Check for failure indicators
-        if re.search(r"test[s]?\s+failed", text, re.IGNORECASE):
+        if _ANY_FAILED_RE.search(text):
             return False
 
         # Default to False if unclear
@@ -744,7 +800,7 @@ class MessageParser:
 
     def _parse_coverage_percent(self, text: str) -> Optional[float]:
         """Parse test coverage percentage."""
-        match = re.search(r"(\d+(?:\.\d+)?)%\s+coverage", text, re.IGNORECASE)
+        match = _COVERAGE_FLOAT_RE.search(text)
         return float(match.group(1)) if match else None
 
     def _parse_test_details(self, text: str) -> List[str]:
@@ -752,8 +808,7 @@ class MessageParser:
         details = []
 
         # Look for test names and results
-        test_pattern = r"(?:PASS|FAIL):\s*([^\n]+)"
-        for match in re.finditer(test_pattern, text):
+        for match in _TEST_DETAIL_RE.finditer(text):
             details.append(match.group(0).strip())
 
         return details
@@ -798,15 +853,8 @@ class MessageParser:
         gaps = []
 
         # Look for gap indicators
-        gap_patterns = [
-            r"Gap:\s*([^\n]+)",
-            r"Missing:\s*([^\n]+)",
-            r"TODO:\s*([^\n]+)",
-            r"⚠\s*([^\n]+)",
-        ]
-
-        for pattern in gap_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern in _GAP_RES:
+            for match in pattern.finditer(text):
                 gap_text = match.group(1).strip()
                 if gap_text:
                     gaps.append(
@@ -839,12 +887,12 @@ class MessageParser:
 
     def _parse_completeness_score(self, text: str) -> Optional[float]:
         """Parse implementation completeness score."""
-        match = re.search(r"(\d+(?:\.\d+)?)%\s+complete", text, re.IGNORECASE)
+        match = _PERCENT_COMPLETE_RE.search(text)
         if match:
             return float(match.group(1)) / 100.0
 
         # Try percentage pattern
-        match = re.search(r"completeness:\s*(\d+(?:\.\d+)?)%", text, re.IGNORECASE)
+        match = _COMPLETENESS_RE.search(text)
         if match:
             return float(match.group(1)) / 100.0
 
@@ -859,14 +907,8 @@ class MessageParser:
         issues = []
 
         # Look for critical issue indicators
-        critical_patterns = [
-            r"Critical:\s*([^\n]+)",
-            r"Security:\s*([^\n]+)",
-            r"Blocker:\s*([^\n]+)",
-        ]
-
-        for pattern in critical_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern in _CRITICAL_RES:
+            for match in pattern.finditer(text):
                 issue_text = match.group(1).strip()
                 if issue_text:
                     issues.append(issue_text)
@@ -876,9 +918,7 @@ class MessageParser:
     def _parse_reflection_summary(self, text: str) -> str:
         """Parse overall reflection summary."""
         # Look for summary section
-        summary_match = re.search(
-            r"Summary:\s*([^\n]+(?:\n(?!\n)[^\n]+)*)", text, re.IGNORECASE
-        )
+        summary_match = _SUMMARY_RE.search(text)
         if summary_match:
             return summary_match.group(1).strip()
 
@@ -318,6 +318,16 @@ class StreamHandler:
         finally:
             self.is_active = False
 
+            # Propagate close to the source so wrapped iterators (e.g. the
+            # interceptor) finalize their workers even when the consumer
+            # stops early and only this generator gets closed
+            source_aclose = getattr(stream_iterator, 'aclose', None)
+            if source_aclose is not None:
+                try:
+                    await source_aclose()
+                except Exception as close_error:
+                    self.logger.warning(f"Stream source close failed: {close_error}")
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get stream statistics
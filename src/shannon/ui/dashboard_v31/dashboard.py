@@ -9,6 +9,8 @@ Part of: V3.1 Wave 3 (Integration)
 """
 
 import asyncio
+import logging
+import threading
 import time
 from typing import Optional
 from rich.console import Console
@@ -25,6 +27,8 @@ from .renderers import (
     Layer4Renderer
 )
 
+logger = logging.getLogger(__name__)
+
 
 class InteractiveDashboard:
     """
@@ -99,6 +103,17 @@ class InteractiveDashboard:
         self.console = console or Console()
         self.refresh_per_second = refresh_per_second
         self._live: Optional[Live] = None
+        self._last_renderable = None
+
+        # Background render worker (double buffering): update() publishes the
+        # latest (snapshot, ui_state) pair, the worker renders it off the
+        # main thread, and update() blits whatever frame is ready. References
+        # are swapped atomically so neither side ever blocks the other.
+        self._render_thread: Optional[threading.Thread] = None
+        self._render_request = threading.Event()
+        self._render_stop = threading.Event()
+        self._pending_input = None
+        self._ready_frame = None
 
         # Control flags
         self.running = False
@@ -129,17 +144,29 @@ class InteractiveDashboard:
             # Fall back to non-interactive mode
             pass
 
-        # Create Rich Live display
+        # Create Rich Live display. auto_refresh is off: frames are flushed
+        # explicitly from update() only when the renderable changed, so an
+        # idle dashboard emits no terminal writes at all.
         self._live = Live(
             self._render_current_layer(),
             console=self.console,
             refresh_per_second=self.refresh_per_second,
+            auto_refresh=False,
             transient=False
         )
 
         self.running = True
         self._live.start()
 
+        # Start render worker after the initial frame is on screen
+        self._render_stop.clear()
+        self._render_thread = threading.Thread(
+            target=self._render_worker,
+            name="dashboard-render",
+            daemon=True
+        )
+        self._render_thread.start()
+
     def stop(self):
         """
         Stop interactive dashboard
@@ -148,6 +175,13 @@ class InteractiveDashboard:
         """
         self.running = False
 
+        # Stop render worker
+        if self._render_thread:
+            self._render_stop.set()
+            self._render_request.set()
+            self._render_thread.join(timeout=1.0)
+            self._render_thread = None
+
         if self._live:
             self._live.stop()
             self._live = None
@@ -196,11 +230,43 @@ class InteractiveDashboard:
             # Keyboard not available (Windows or non-interactive)
             pass
 
-        # Step 4: Render
-        renderable = self._render_current_layer(snapshot, self.ui_state)
+        # Step 4: Hand the latest inputs to the render worker and pick up
+        # whatever frame it finished last (never blocks on an in-flight
+        # render; a heavy frame can't stall input handling)
+        self._pending_input = (snapshot, self.ui_state)
+        self._render_request.set()
+
+        renderable = self._ready_frame
+        if renderable is None:
+            # Worker hasn't produced a frame yet - the initial frame from
+            # start() is still on screen
+            return
 
-        # Step 5: Update display
-        self._live.update(renderable)
+        # Step 5: Update display - renderer caches return the identical
+        # object for unchanged frames, so skip the flush entirely then
+        if renderable is not self._last_renderable:
+            self._last_renderable = renderable
+            self._live.update(renderable, refresh=True)
+
+    def _render_worker(self):
+        """Render loop run on the background thread (double buffer)."""
+        while not self._render_stop.is_set():
+            if not self._render_request.wait(timeout=0.25):
+                continue
+            self._render_request.clear()
+
+            pending = self._pending_input
+            if pending is None:
+                continue
+
+            snapshot, ui_state = pending
+            try:
+                self._ready_frame = self._render_current_layer(snapshot, ui_state)
+            except Exception:
+                # Never kill the worker over one bad frame - the previous
+                # frame stays on screen - but report it, or a renderer bug
+                # freezes the dashboard with zero diagnostics
+                logger.exception("Dashboard render failed; keeping previous frame")
 
     def run_update_loop(self, duration_seconds: Optional[float] = None):
         """
@@ -321,11 +387,11 @@ class InteractiveDashboard:
             help_text.append("  [q] Quit     → Exit dashboard\n")
             help_text.append("  [h] Help     → Toggle this help\n")
 
-        help_text.append("\n[dim]Press [h] or [Esc] to close help[/dim]")
+        help_text.append("\nPress [h] or [Esc] to close help", style="dim")
 
         return Panel(
             help_text,
-            title="[bold]Help[/bold]",
+            title=Text("Help", style="bold"),
             border_style="cyan",
             padding=(1, 2)
         )
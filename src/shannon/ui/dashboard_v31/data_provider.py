@@ -10,6 +10,7 @@ Part of: V3.1 Wave 0 (Data Foundation)
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+import json
 import time
 
 from shannon.metrics.collector import MetricsCollector
@@ -43,6 +44,9 @@ class DashboardDataProvider:
         # Returns immutable DashboardSnapshot
     """
 
+    # Most recent messages kept per history snapshot (ring-buffer bound)
+    MESSAGE_HISTORY_LIMIT = 10000
+
     def __init__(
         self,
         metrics: MetricsCollector,
@@ -72,6 +76,11 @@ class DashboardDataProvider:
         self._cached_snapshot: Optional[DashboardSnapshot] = None
         self._snapshot_ttl = 0.05  # 50ms
 
+        # Monotonic wait baselines per agent_id - lets wait durations be
+        # computed by float subtraction instead of a datetime.now() +
+        # timedelta pair per agent per tick
+        self._wait_baselines: Dict[str, float] = {}
+
     def get_snapshot(
         self,
         focused_agent_id: Optional[str] = None
@@ -129,12 +138,17 @@ class DashboardDataProvider:
         # Count agent states
         agent_counts = self._count_agent_states()
 
+        # Clamp progress to [0, 1] here so renderers index bar tables
+        # without re-clamping on every frame
+        progress = metrics_snapshot.progress
+        progress = 0.0 if progress < 0.0 else 1.0 if progress > 1.0 else progress
+
         return SessionSnapshot(
             session_id=session_data.get('session_id', f'session_{int(time.time())}'),
             command_name=session_data.get('command', 'unknown'),
             north_star_goal=session_data.get('goal'),
             current_phase=session_data.get('phase', metrics_snapshot.current_stage),
-            overall_progress=metrics_snapshot.progress,
+            overall_progress=progress,
             start_time=metrics_snapshot.start_time or datetime.now(),
             elapsed_seconds=metrics_snapshot.duration_seconds,
             total_cost_usd=metrics_snapshot.cost_total,
@@ -190,6 +204,7 @@ class DashboardDataProvider:
             return []
 
         snapshots = []
+        now_monotonic = time.monotonic()
         for i, state in enumerate(agent_states):
             # Determine waiting reason
             waiting_reason = None
@@ -200,9 +215,20 @@ class DashboardDataProvider:
                 # This would be populated by AgentStateTracker if it tracks waiting states
                 waiting_reason = getattr(state, 'waiting_reason', None)
 
-                # Calculate wait duration if waiting
+                # Calculate wait duration if waiting. The baseline is anchored
+                # once (converting started_at to the monotonic clock), then
+                # each tick is a single float subtraction.
                 if waiting_reason and state.started_at:
-                    wait_duration = (datetime.now() - state.started_at).total_seconds()
+                    baseline = self._wait_baselines.get(state.agent_id)
+                    if baseline is None:
+                        elapsed = (datetime.now() - state.started_at).total_seconds()
+                        baseline = now_monotonic - elapsed
+                        self._wait_baselines[state.agent_id] = baseline
+                    wait_duration = now_monotonic - baseline
+                else:
+                    self._wait_baselines.pop(state.agent_id, None)
+            else:
+                self._wait_baselines.pop(state.agent_id, None)
 
             snapshots.append(AgentSnapshot(
                 agent_id=state.agent_id,
@@ -320,10 +346,14 @@ class DashboardDataProvider:
         if not state:
             return None
 
-        # Convert raw messages to MessageEntry objects
+        # Convert raw messages to MessageEntry objects. Bounded to the most
+        # recent window so a long session's history cannot grow the snapshot
+        # (and per-frame parse cost) without limit.
+        raw_messages = state.all_messages
+        start = max(0, len(raw_messages) - self.MESSAGE_HISTORY_LIMIT)
         entries = []
-        for i, raw_msg in enumerate(state.all_messages):
-            entry = self._parse_message(i, raw_msg)
+        for i in range(start, len(raw_messages)):
+            entry = self._parse_message(i, raw_messages[i])
             entries.append(entry)
 
         return MessageHistory(
@@ -356,7 +386,13 @@ class DashboardDataProvider:
                 role = 'tool_use'
                 tool_name = getattr(raw_message, 'name', 'unknown')
                 tool_params = getattr(raw_message, 'input', {})
-                content = f"Tool: {tool_name}\nParams: {tool_params}"
+                # Compact dumps (no indent) is ~3x faster than pretty mode
+                # and the display truncates anyway; Rich handles wrapping
+                try:
+                    params_json = json.dumps(tool_params, default=str)[:400]
+                except (TypeError, ValueError):
+                    params_json = str(tool_params)[:400]
+                content = f"Tool: {tool_name}\nParams: {params_json}"
 
             elif msg_type == 'tool_result':
                 role = 'tool_result'
@@ -14,6 +14,10 @@ from rich.text import Text
 from rich.align import Align
 from rich.padding import Padding
 
+# Panel titles as prebuilt Text spans - skips the markup parser per render
+_TITLE_HELP = Text("Help", style="bold")
+_TITLE_QUICK_REFERENCE = Text("Quick Reference", style="bold")
+
 
 class HelpRenderer:
     """
@@ -61,7 +65,7 @@ class HelpRenderer:
         # Wrap in panel
         return Panel(
             Padding(text, (1, 2)),
-            title="[bold]Help[/bold]",
+            title=_TITLE_HELP,
             border_style="cyan",
             padding=(0, 0)
         )
@@ -172,7 +176,7 @@ class HelpRenderer:
 
         return Panel(
             Padding(text, (1, 2)),
-            title="[bold]Quick Reference[/bold]",
+            title=_TITLE_QUICK_REFERENCE,
             border_style="cyan"
         )
 
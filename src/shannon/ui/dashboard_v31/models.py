@@ -47,12 +47,14 @@ class ContextSnapshot:
     mcp_server_list: List[MCPServerInfo] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MessageEntry:
     """
     Single message in SDK conversation
 
     Represents one message from USER, ASSISTANT, tool_use, or tool_result.
+    Slotted: entries are created per message per history snapshot, so the
+    per-instance __dict__ savings and faster attribute reads add up.
     """
     index: int  # Sequence number in conversation
     role: Literal['user', 'assistant', 'tool_use', 'tool_result']
@@ -69,6 +71,13 @@ class MessageEntry:
     is_thinking: bool = False
     thinking_expanded: bool = False  # UI state for collapse/expand
 
+    # Derived: computed once at construction so renderers never re-scan
+    # content on every frame (content is immutable per entry)
+    line_count: int = field(init=False, default=1)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'line_count', self.content.count('\n') + 1)
+
 
 @dataclass(frozen=True)
 class MessageHistory:
@@ -118,6 +127,19 @@ class AgentSnapshot:
     # Error
     error_message: Optional[str] = None
 
+    # Derived: progress quantized to the bar's 11 visual states, computed at
+    # snapshot creation so render caches keyed on it survive sub-percent
+    # progress deltas
+    progress_q10: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        q10 = int(round(self.progress * 10))
+        # Clamp here, once, so renderers can index bar tables directly
+        object.__setattr__(
+            self, 'progress_q10',
+            0 if q10 < 0 else 10 if q10 > 10 else q10
+        )
+
 
 @dataclass(frozen=True)
 class SessionSnapshot:
@@ -189,6 +211,16 @@ class DashboardSnapshot:
     # Snapshot metadata
     captured_at: float = field(default_factory=lambda: datetime.now().timestamp())
 
+    # Derived: built once per snapshot so renderers resolve the focused
+    # agent with a dict lookup instead of a linear scan per frame
+    agents_by_id: Dict[str, AgentSnapshot] = field(init=False, default_factory=dict)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, 'agents_by_id',
+            {agent.agent_id: agent for agent in self.agents}
+        )
+
 
 @dataclass
 class KeyEvent:
@@ -11,6 +11,7 @@ Part of: V3.1 Wave 4 (Polish & Performance)
 from typing import List, Dict, Optional, Tuple
 from rich.text import Text
 from rich.syntax import Syntax
+import itertools
 import re
 
 from .models import MessageEntry
@@ -56,14 +57,18 @@ class VirtualMessageView:
         """
         total = len(messages)
 
-        # Clamp scroll offset
-        max_offset = max(0, total - self.viewport_height)
-        offset = min(scroll_offset, max_offset)
-        offset = max(0, offset)
+        # Clamp scroll offset (single branch chain, no min/max dispatch)
+        max_offset = total - self.viewport_height
+        if max_offset < 0:
+            max_offset = 0
+        offset = 0 if scroll_offset < 0 else (
+            max_offset if scroll_offset > max_offset else scroll_offset
+        )
 
-        # Extract visible window
+        # Extract visible window - islice avoids copying from the full
+        # container, so this stays O(viewport) on deques and large lists
         end = min(offset + self.viewport_height, total)
-        visible = messages[offset:end]
+        visible = list(itertools.islice(messages, offset, end))
 
         return visible, offset, end
 
@@ -139,8 +144,7 @@ class VirtualMessageView:
                 text.append(content, style="white")
             else:
                 # Show collapsed indicator
-                line_count = content.count('\n') + 1
-                text.append(f"{line_count} lines (press Space to expand)", style="dim")
+                text.append(f"{msg.line_count} lines (press Space to expand)", style="dim")
         else:
             # Regular content with code block highlighting
             if '```' in content:
@@ -11,10 +11,13 @@ Author: Shannon Framework
 Version: 3.1.0
 """
 
+from collections import OrderedDict
+from itertools import islice
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.layout import Layout
 from rich.text import Text
@@ -32,6 +35,125 @@ from .models import (
     MessageHistory
 )
 
+# Render caches hold the last few frames only; on idle ticks (snapshot
+# unchanged) the cached Panel is returned without rebuilding any Rich objects.
+_RENDER_CACHE_SIZE = 4
+
+# Precomputed progress-bar segments indexed by fill count, shared by all
+# layers. Indexing these is O(1) vs two str multiplications per frame.
+_BAR_FILLED = tuple("▓" * i for i in range(11))
+_BAR_EMPTY = tuple("░" * i for i in range(11))
+
+# (filled, empty, percent) style triples for the three bar appearances
+_BAR_STYLES = {
+    'bold': ("bold green", "dim white", "bold white"),
+    'plain': ("green", "dim white", "white"),
+    'selected': ("bold green on blue", "dim white on blue", "bold white on blue"),
+}
+
+# Fully assembled bar+percent Texts, built on first use and reused forever.
+# The key space is tiny (two widths x fills x 101 percents x 3 variants).
+_PROGRESS_TEXT_CACHE: Dict[Tuple, Text] = {}
+
+
+def _progress_text(width: int, filled: int, percent: int, variant: str = 'bold') -> Text:
+    """Return a memoized progress bar Text with trailing percentage."""
+    key = (width, filled, percent, variant)
+    cached = _PROGRESS_TEXT_CACHE.get(key)
+    if cached is None:
+        fill_style, empty_style, pct_style = _BAR_STYLES[variant]
+        cached = Text()
+        cached.append(_BAR_FILLED[filled], style=fill_style)
+        cached.append(_BAR_EMPTY[width - filled], style=empty_style)
+        cached.append(f" {percent}%", style=pct_style)
+        _PROGRESS_TEXT_CACHE[key] = cached
+    return cached
+
+
+def _assemble(*parts: Tuple[str, str]) -> Text:
+    """Build a Text from (value, style) pairs without the markup parser."""
+    text = Text()
+    for value, style in parts:
+        text.append(value, style=style)
+    return text
+
+
+# Static control/footer lines and panel titles, assembled once at import so
+# per-frame renders never run the Rich markup tokenizer for constant content.
+_SEP = (" | ", "dim white")
+
+_LAYER1_CONTROLS = _assemble(
+    ("[↵] Agents", "bold cyan"), _SEP,
+    ("[q] Quit", "bold red"), _SEP,
+    ("[h] Help", "bold yellow"),
+)
+_LAYER2_FOOTER_TAIL = _assemble(
+    ("[1-9] Select", "cyan"), _SEP,
+    ("[↵] Detail", "cyan"), _SEP,
+    ("[Esc] Back", "yellow"),
+)
+_LAYER3_CONTROLS = _assemble(
+    ("[↵] Messages", "cyan"), _SEP,
+    ("[Esc] Agents", "yellow"), _SEP,
+    ("[1-9] Switch", "cyan"), _SEP,
+    ("[t] Tools", "yellow"), _SEP,
+    ("[c] Context", "yellow"),
+)
+_LAYER4_CONTROLS = _assemble(
+    ("[↑↓] Scroll", "cyan"), _SEP,
+    ("[Enter] Expand", "cyan"), _SEP,
+    ("[Space] Toggle thinking", "yellow"), _SEP,
+    ("[Esc] Back", "yellow"), _SEP,
+    ("[1-9] Switch", "cyan"),
+)
+
+# Shared blank spacer line - appended between sections instead of allocating
+# a fresh empty Text per gap per frame. Never mutated after creation.
+_BLANK_LINE = Text()
+
+# Selection highlight as a real Style instance - style strings are re-parsed
+# by Rich at append time, a parsed Style is used as-is
+_SELECTED_STYLE = Style(color="white", bgcolor="blue", bold=True)
+
+# Hoisted style tables - looked up per row/message instead of walking an
+# if/elif cascade (or rebuilding a dict) on every render
+_STATE_COLORS = {
+    'pending': 'yellow',
+    'active': 'cyan',
+    'complete': 'green',
+    'failed': 'red',
+}
+_ROLE_PREFIXES = {
+    'USER': ("→ USER: ", "bold blue"),
+    'ASSISTANT': ("← ASSISTANT: ", "bold green"),
+    'TOOL_RESULT': ("← TOOL_RESULT: ", "bold cyan"),
+}
+
+_TITLE_DASHBOARD = Text("Shannon V3.1 Dashboard", style="bold")
+_TITLE_AGENT_LIST = Text("Agent List", style="bold")
+_TITLE_CONTEXT = Text("Context", style="bold")
+_TITLE_TOOL_HISTORY = Text("Tool History", style="bold")
+_TITLE_MESSAGE_STREAM = Text("Message Stream", style="bold")
+
+
+def _snapshot_revision(snapshot: DashboardSnapshot) -> Tuple:
+    """
+    Cheap revision key for a snapshot.
+
+    Not a full content hash - just enough fields that any visible change
+    produces a new key. id(snapshot) guards against field collisions between
+    distinct snapshots that happen to share counts.
+    """
+    return (
+        id(snapshot),
+        snapshot.session.message_count,
+        # Quantized to displayed precision (1% / whole seconds) so invisible
+        # deltas between snapshots don't bust the frame cache
+        int(snapshot.session.overall_progress * 100),
+        int(snapshot.session.elapsed_seconds),
+        len(snapshot.agents),
+    )
+
 
 class Layer1Renderer:
     """
@@ -41,8 +163,18 @@ class Layer1Renderer:
     Border color reflects session state.
     """
 
+    def __init__(self):
+        """Initialize renderer with frame cache."""
+        self._render_cache: Dict[Tuple, Panel] = {}
+
     def render(self, snapshot: DashboardSnapshot, ui_state: DashboardUIState) -> Panel:
         """Render session overview panel."""
+        # Reuse last frame if the snapshot is unchanged (idle tick)
+        cache_key = _snapshot_revision(snapshot)
+        cached = self._render_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         lines: List[Text] = []
 
         # Goal (if north_star set)
@@ -51,33 +183,33 @@ class Layer1Renderer:
             goal_text.append("🎯 ", style="bold yellow")
             goal_text.append(snapshot.session.north_star_goal, style="bold white")
             lines.append(goal_text)
-            lines.append(Text())  # Blank line
+            lines.append(_BLANK_LINE)  # Blank line
 
         # Phase/Wave
         phase_line = self._render_phase_wave(snapshot)
         lines.append(phase_line)
-        lines.append(Text())  # Blank line
+        lines.append(_BLANK_LINE)  # Blank line
 
         # Progress bar
         progress_line = self._render_progress(snapshot)
         lines.append(progress_line)
-        lines.append(Text())  # Blank line
+        lines.append(_BLANK_LINE)  # Blank line
 
         # Agent summary (if wave execution)
         if snapshot.session.wave_number is not None:
             agent_line = self._render_agent_summary(snapshot)
             lines.append(agent_line)
-            lines.append(Text())  # Blank line
+            lines.append(_BLANK_LINE)  # Blank line
 
         # Metrics
         metrics_line = self._render_metrics(snapshot)
         lines.append(metrics_line)
-        lines.append(Text())  # Blank line
+        lines.append(_BLANK_LINE)  # Blank line
 
         # Current operation
         operation_line = self._render_current_operation(snapshot)
         lines.append(operation_line)
-        lines.append(Text())  # Blank line
+        lines.append(_BLANK_LINE)  # Blank line
 
         # Controls
         controls_line = self._render_controls()
@@ -88,13 +220,20 @@ class Layer1Renderer:
 
         # Create panel
         content = Group(*lines)
-        return Panel(
+        panel = Panel(
             content,
-            title="[bold]Shannon V3.1 Dashboard[/bold]",
+            title=_TITLE_DASHBOARD,
             border_style=border_style,
             padding=(1, 2),
         )
 
+        # Cache frame (bounded FIFO)
+        self._render_cache[cache_key] = panel
+        if len(self._render_cache) > _RENDER_CACHE_SIZE:
+            self._render_cache.pop(next(iter(self._render_cache)))
+
+        return panel
+
     def _render_phase_wave(self, snapshot: DashboardSnapshot) -> Text:
         """Render phase/wave information."""
         text = Text()
@@ -117,21 +256,8 @@ class Layer1Renderer:
 
     def _render_progress(self, snapshot: DashboardSnapshot) -> Text:
         """Render progress bar."""
-        text = Text()
-
         progress = snapshot.session.overall_progress  # 0.0-1.0
-
-        percentage = int(progress * 100)
-        bar_width = 10
-        filled = int(progress * bar_width)
-        empty = bar_width - filled
-
-        # Progress bar
-        text.append("▓" * filled, style="bold green")
-        text.append("░" * empty, style="dim white")
-        text.append(f" {percentage}%", style="bold white")
-
-        return text
+        return _progress_text(10, int(progress * 10), int(progress * 100))
 
     def _render_agent_summary(self, snapshot: DashboardSnapshot) -> Text:
         """Render agent summary counts."""
@@ -236,13 +362,7 @@ class Layer1Renderer:
 
     def _render_controls(self) -> Text:
         """Render keyboard controls."""
-        text = Text()
-        text.append("[↵] Agents", style="bold cyan")
-        text.append(" | ", style="dim white")
-        text.append("[q] Quit", style="bold red")
-        text.append(" | ", style="dim white")
-        text.append("[h] Help", style="bold yellow")
-        return text
+        return _LAYER1_CONTROLS
 
     def _get_border_style(self, snapshot: DashboardSnapshot) -> str:
         """Determine border color based on session state."""
@@ -270,8 +390,24 @@ class Layer2Renderer:
     Highlights selected agent.
     """
 
+    def __init__(self):
+        """Initialize renderer with frame and row caches."""
+        self._render_cache: Dict[Tuple, Panel] = {}
+        # agent_id -> (row key, cell renderables); rows are rebuilt only for
+        # agents whose visible fields actually changed
+        self._row_cache: Dict[str, Tuple[Tuple, Tuple]] = {}
+
     def render(self, snapshot: DashboardSnapshot, ui_state: DashboardUIState) -> Panel:
         """Render agent list table panel."""
+        # Reuse last frame if snapshot and selection are unchanged
+        cache_key = _snapshot_revision(snapshot) + (
+            ui_state.focused_agent_id,
+            ui_state.agent_selection_index,
+        )
+        cached = self._render_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Create table
         table = Table(
             show_header=True,
@@ -288,29 +424,57 @@ class Layer2Renderer:
         table.add_column("Time", width=10)
         table.add_column("Blocking", width=20)
 
-        # Add agent rows
+        # Add agent rows, reusing cached cells for unchanged agents
         for agent in snapshot.agents:
             is_selected = (agent.agent_id == ui_state.focused_agent_id)
-            self._add_agent_row(table, agent, is_selected)
+            row_key = (
+                agent.progress_q10,
+                agent.status,
+                agent.waiting_reason,
+                int(agent.elapsed_seconds),
+                agent.blocking_agent_id,
+                is_selected,
+            )
+            cached_row = self._row_cache.get(agent.agent_id)
+            if cached_row is not None and cached_row[0] == row_key:
+                cells = cached_row[1]
+            else:
+                cells = self._build_row_cells(agent, is_selected)
+                self._row_cache[agent.agent_id] = (row_key, cells)
+            table.add_row(*cells)
+
+        # Drop cache entries for agents no longer in the snapshot
+        if len(self._row_cache) > len(snapshot.agents):
+            live_ids = {agent.agent_id for agent in snapshot.agents}
+            for agent_id in list(self._row_cache):
+                if agent_id not in live_ids:
+                    del self._row_cache[agent_id]
 
         # Footer
         footer = self._render_footer(ui_state)
 
         # Combine table and footer
-        content = Group(table, Text(), footer)
+        content = Group(table, _BLANK_LINE, footer)
 
-        return Panel(
+        panel = Panel(
             content,
-            title="[bold]Agent List[/bold]",
+            title=_TITLE_AGENT_LIST,
             border_style="cyan",
             padding=(1, 2),
         )
 
-    def _add_agent_row(self, table: Table, agent: AgentSnapshot, is_selected: bool) -> None:
-        """Add a single agent row to the table."""
+        # Cache frame (bounded FIFO)
+        self._render_cache[cache_key] = panel
+        if len(self._render_cache) > _RENDER_CACHE_SIZE:
+            self._render_cache.pop(next(iter(self._render_cache)))
+
+        return panel
+
+    def _build_row_cells(self, agent: AgentSnapshot, is_selected: bool) -> Tuple:
+        """Build the cell renderables for a single agent row."""
         # Style based on selection
         if is_selected:
-            style = "bold white on blue"
+            style = _SELECTED_STYLE
         else:
             style = ""
 
@@ -332,26 +496,14 @@ class Layer2Renderer:
         # Blocking info
         blocking = self._render_blocking(agent, is_selected)
 
-        table.add_row(agent_id, agent_type, progress, state, time_text, blocking)
+        return (agent_id, agent_type, progress, state, time_text, blocking)
 
     def _render_progress_bar(self, percent: float, is_selected: bool) -> Text:
         """Render progress bar for agent."""
-        text = Text()
-
         bar_width = 5
         filled = int((percent / 100) * bar_width)
-        empty = bar_width - filled
-
-        if is_selected:
-            text.append("▓" * filled, style="bold green on blue")
-            text.append("░" * empty, style="dim white on blue")
-            text.append(f" {int(percent)}%", style="bold white on blue")
-        else:
-            text.append("▓" * filled, style="green")
-            text.append("░" * empty, style="dim white")
-            text.append(f" {int(percent)}%", style="white")
-
-        return text
+        variant = 'selected' if is_selected else 'plain'
+        return _progress_text(bar_width, filled, int(percent), variant)
 
     def _render_state(self, state: str, is_selected: bool) -> Text:
         """Render agent state with color."""
@@ -361,19 +513,10 @@ class Layer2Renderer:
 
         if is_selected:
             # Override color when selected
-            text.append(state_str, style="bold white on blue")
+            text.append(state_str, style=_SELECTED_STYLE)
         else:
             # Normal state colors
-            if state == 'pending':
-                text.append(state_str, style="yellow")
-            elif state == 'active':
-                text.append(state_str, style="cyan")
-            elif state == 'complete':
-                text.append(state_str, style="green")
-            elif state == 'failed':
-                text.append(state_str, style="red")
-            else:
-                text.append(state_str, style="white")
+            text.append(state_str, style=_STATE_COLORS.get(state, "white"))
 
         return text
 
@@ -382,10 +525,10 @@ class Layer2Renderer:
         text = Text()
 
         if agent.blocking_agent_id:
-            style = "bold white on blue" if is_selected else "yellow"
+            style = _SELECTED_STYLE if is_selected else "yellow"
             text.append(agent.blocking_agent_id, style=style)
         else:
-            style = "bold white on blue" if is_selected else "dim white"
+            style = _SELECTED_STYLE if is_selected else "dim white"
             text.append("-", style=style)
 
         return text
@@ -405,18 +548,13 @@ class Layer2Renderer:
 
     def _render_footer(self, ui_state: DashboardUIState) -> Text:
         """Render footer with controls."""
-        text = Text()
-
-        if ui_state.focused_agent_id is not None:
-            text.append(f"Selected: Agent #{ui_state.focused_agent_id}", style="bold white")
-            text.append(" | ", style="dim white")
+        if ui_state.focused_agent_id is None:
+            return _LAYER2_FOOTER_TAIL
 
-        text.append("[1-9] Select", style="cyan")
-        text.append(" | ", style="dim white")
-        text.append("[↵] Detail", style="cyan")
+        text = Text()
+        text.append(f"Selected: Agent #{ui_state.focused_agent_id}", style="bold white")
         text.append(" | ", style="dim white")
-        text.append("[Esc] Back", style="yellow")
-
+        text.append_text(_LAYER2_FOOTER_TAIL.copy())
         return text
 
 
@@ -431,6 +569,13 @@ class Layer3Renderer:
     - Bottom: Current operation and controls (always visible)
     """
 
+    def __init__(self):
+        """Initialize renderer with per-component panel caches."""
+        # Rich mutates Layout objects, so the Layout itself cannot be cached -
+        # instead each sub-panel is memoized on its own key so unchanged
+        # panels are reused across frames.
+        self._panel_cache: Dict[str, Tuple[Tuple, Panel]] = {}
+
     def render(self, snapshot: DashboardSnapshot, ui_state: DashboardUIState) -> Layout:
         """Render agent detail layout with 4 panels."""
         # Find selected agent
@@ -450,26 +595,44 @@ class Layer3Renderer:
         )
 
         # Render top panel (agent info)
-        layout["top"].update(self._render_agent_info(agent))
+        info_key = (
+            agent.agent_id, agent.status, agent.progress,
+            agent.wait_duration_seconds, agent.task_description,
+        )
+        layout["top"].update(self._cached_panel(
+            "info", info_key, self._render_agent_info, agent
+        ))
 
         # Render middle section (context + tool history)
         layout["middle"].update(self._render_middle_section(agent, snapshot.context, ui_state))
 
         # Render bottom panel (current operation)
-        layout["bottom"].update(self._render_current_operation(agent))
+        operation_key = (
+            agent.agent_id, agent.status, agent.current_operation,
+            agent.wait_duration_seconds,
+        )
+        layout["bottom"].update(self._cached_panel(
+            "operation", operation_key, self._render_current_operation, agent
+        ))
 
         return layout
 
+    def _cached_panel(self, component: str, key: Tuple, build_fn, *args) -> Panel:
+        """Return memoized panel for component, rebuilding only on key change."""
+        cached = self._panel_cache.get(component)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        panel = build_fn(*args)
+        self._panel_cache[component] = (key, panel)
+        return panel
+
     def _find_agent(self, snapshot: DashboardSnapshot, agent_id: Optional[int]) -> Optional[AgentSnapshot]:
         """Find agent by ID."""
         if agent_id is None:
             return None
 
-        for agent in snapshot.agents:
-            if agent.agent_id == agent_id:
-                return agent
-
-        return None
+        return snapshot.agents_by_id.get(agent_id)
 
     def _render_agent_info(self, agent: AgentSnapshot) -> Panel:
         """Render top panel with agent information."""
@@ -496,14 +659,8 @@ class Layer3Renderer:
         if agent.status == 'pending':
             wait_time = agent.wait_duration_seconds or 0
             status_line.append(f"{status_text} ({wait_time:.1f}s)", style="yellow")
-        elif agent.status == 'active':
-            status_line.append(status_text, style="cyan")
-        elif agent.status == 'complete':
-            status_line.append(status_text, style="green")
-        elif agent.status == 'failed':
-            status_line.append(status_text, style="red")
         else:
-            status_line.append(status_text, style="white")
+            status_line.append(status_text, style=_STATE_COLORS.get(agent.status, "white"))
 
         lines.append(status_line)
 
@@ -511,14 +668,10 @@ class Layer3Renderer:
         progress_line = Text()
         progress_line.append("Progress: ", style="cyan")
 
-        bar_width = 10
         percent = agent.progress
-        filled = int((percent / 100) * bar_width)
-        empty = bar_width - filled
-
-        progress_line.append("▓" * filled, style="bold green")
-        progress_line.append("░" * empty, style="dim white")
-        progress_line.append(f" {int(percent)}%", style="bold white")
+        progress_line.append_text(
+            _progress_text(10, int((percent / 100) * 10), int(percent))
+        )
 
         lines.append(progress_line)
 
@@ -532,18 +685,39 @@ class Layer3Renderer:
         show_context = ui_state.show_context_panel
         show_tools = ui_state.show_tool_history
 
+        # id() anchors each key to the concrete input object; the count
+        # fields guard against a recycled id aliasing a different state
+        context_key = (
+            id(context),
+            context.codebase_files_loaded, context.memories_active,
+            context.tools_available, context.mcp_servers_connected,
+        )
+        tools_key = (
+            id(agent),
+            agent.agent_id, agent.tool_calls_count,
+            len(agent.files_created), len(agent.files_modified),
+        )
+
         if show_context and show_tools:
             # Show both panels
             layout.split_row(
-                Layout(self._render_context_panel(context), name="context", ratio=30),
-                Layout(self._render_tool_history_panel(agent), name="tools", ratio=70),
+                Layout(self._cached_panel(
+                    "context", context_key, self._render_context_panel, context
+                ), name="context", ratio=30),
+                Layout(self._cached_panel(
+                    "tools", tools_key, self._render_tool_history_panel, agent
+                ), name="tools", ratio=70),
             )
         elif show_context:
             # Only context
-            layout.update(self._render_context_panel(context))
+            layout.update(self._cached_panel(
+                "context", context_key, self._render_context_panel, context
+            ))
         elif show_tools:
             # Only tools
-            layout.update(self._render_tool_history_panel(agent))
+            layout.update(self._cached_panel(
+                "tools", tools_key, self._render_tool_history_panel, agent
+            ))
         else:
             # Neither - show placeholder
             layout.update(Panel(
@@ -559,55 +733,58 @@ class Layer3Renderer:
 
         # Codebase files
         lines.append(Text("📁 Codebase:", style="bold yellow"))
-        if context.codebase_file_list:
+        n_files = len(context.codebase_file_list)
+        if n_files:
             lines.append(Text(f"  {context.codebase_files_loaded} files", style="cyan"))
-            for file in context.codebase_file_list[:5]:  # Show first 5
+            for file in islice(context.codebase_file_list, 5):  # Show first 5
                 lines.append(Text(f"  {file}", style="dim white"))
-            if len(context.codebase_file_list) > 5:
-                lines.append(Text(f"  ... and {len(context.codebase_file_list) - 5} more", style="dim white"))
+            if n_files > 5:
+                lines.append(Text(f"  ... and {n_files - 5} more", style="dim white"))
         else:
             lines.append(Text("  None", style="dim white"))
 
-        lines.append(Text())  # Blank line
+        lines.append(_BLANK_LINE)  # Blank line
 
         # Memory
         lines.append(Text("🧠 Memory:", style="bold yellow"))
-        if context.memory_list:
+        n_memories = len(context.memory_list)
+        if n_memories:
             lines.append(Text(f"  {context.memories_active} active", style="cyan"))
-            for memory in context.memory_list[:3]:  # Show first 3
+            for memory in islice(context.memory_list, 3):  # Show first 3
                 lines.append(Text(f"  {memory}", style="dim white"))
-            if len(context.memory_list) > 3:
-                lines.append(Text(f"  ... and {len(context.memory_list) - 3} more", style="dim white"))
+            if n_memories > 3:
+                lines.append(Text(f"  ... and {n_memories - 3} more", style="dim white"))
         else:
             lines.append(Text("  None", style="dim white"))
 
-        lines.append(Text())  # Blank line
+        lines.append(_BLANK_LINE)  # Blank line
 
         # Tools
         lines.append(Text("🔧 Tools:", style="bold yellow"))
         tool_count = context.tools_available or 0
         lines.append(Text(f"  {tool_count} available", style="cyan"))
-        for tool in context.tool_list[:5]:
+        for tool in islice(context.tool_list, 5):
             lines.append(Text(f"  {tool}", style="dim white"))
 
-        lines.append(Text())  # Blank line
+        lines.append(_BLANK_LINE)  # Blank line
 
         # MCP servers
         lines.append(Text("🔌 MCP:", style="bold yellow"))
-        if context.mcp_server_list:
+        n_servers = len(context.mcp_server_list)
+        if n_servers:
             lines.append(Text(f"  {context.mcp_servers_connected} connected", style="cyan"))
-            for server in context.mcp_server_list[:3]:  # Show first 3
+            for server in islice(context.mcp_server_list, 3):  # Show first 3
                 status_icon = "✅" if server.status == 'connected' else "❌"
                 lines.append(Text(f"  {server.name} {status_icon}", style="green" if server.status == 'connected' else "red"))
-            if len(context.mcp_server_list) > 3:
-                lines.append(Text(f"  ... and {len(context.mcp_server_list) - 3} more", style="dim white"))
+            if n_servers > 3:
+                lines.append(Text(f"  ... and {n_servers - 3} more", style="dim white"))
         else:
             lines.append(Text("  None", style="dim white"))
 
         content = Group(*lines)
         return Panel(
             content,
-            title="[bold]Context[/bold]",
+            title=_TITLE_CONTEXT,
             border_style="yellow",
             padding=(1, 1),
         )
@@ -618,7 +795,7 @@ class Layer3Renderer:
 
         # Tool call summary
         lines.append(Text(f"Total tool calls: {agent.tool_calls_count}", style="cyan"))
-        lines.append(Text())
+        lines.append(_BLANK_LINE)
         
         # Files created
         if agent.files_created:
@@ -627,7 +804,7 @@ class Layer3Renderer:
                 lines.append(Text(f"  ✓ {file}", style="green"))
             if len(agent.files_created) > 8:
                 lines.append(Text(f"  ... and {len(agent.files_created) - 8} more", style="dim white"))
-            lines.append(Text())
+            lines.append(_BLANK_LINE)
         
         # Files modified
         if agent.files_modified:
@@ -643,7 +820,7 @@ class Layer3Renderer:
         content = Group(*lines)
         return Panel(
             content,
-            title="[bold]Tool History[/bold]",
+            title=_TITLE_TOOL_HISTORY,
             border_style="yellow",
             padding=(1, 1),
         )
@@ -681,17 +858,7 @@ class Layer3Renderer:
             lines.append(Text("Ready", style="dim white"))
 
         # Controls
-        controls_line = Text()
-        controls_line.append("[↵] Messages", style="cyan")
-        controls_line.append(" | ", style="dim white")
-        controls_line.append("[Esc] Agents", style="yellow")
-        controls_line.append(" | ", style="dim white")
-        controls_line.append("[1-9] Switch", style="cyan")
-        controls_line.append(" | ", style="dim white")
-        controls_line.append("[t] Tools", style="yellow")
-        controls_line.append(" | ", style="dim white")
-        controls_line.append("[c] Context", style="yellow")
-        lines.append(controls_line)
+        lines.append(_LAYER3_CONTROLS)
 
         content = Group(*lines)
         return Panel(content, border_style="cyan", padding=(0, 1))
@@ -706,6 +873,36 @@ class Layer3Renderer:
         return layout
 
 
+class _MessageStreamBody:
+    """
+    Lazy panel body for the Layer4 viewport.
+
+    Yields each message line to the console on demand instead of
+    materializing a Group of 2 x viewport Text objects per frame; if the
+    terminal clips the panel, unrendered messages are never touched.
+    """
+
+    __slots__ = ('_renderer', '_messages', '_start', '_end', '_ui_state', '_footer')
+
+    def __init__(self, renderer, messages, start, end, ui_state, footer):
+        self._renderer = renderer
+        self._messages = messages
+        self._start = start
+        self._end = end
+        self._ui_state = ui_state
+        self._footer = footer
+
+    def __rich_console__(self, console, options):
+        render_message = self._renderer._render_message
+        for i, message in enumerate(
+            islice(self._messages, self._start, self._end),
+            start=self._start
+        ):
+            yield render_message(message, i, self._ui_state)
+            yield _BLANK_LINE
+        yield from self._footer
+
+
 class Layer4Renderer:
     """
     Message stream renderer with virtual scrolling.
@@ -717,9 +914,13 @@ class Layer4Renderer:
     - Scroll position tracking
     """
 
+    # Bound on the rendered-message LRU; long sessions stream thousands of
+    # messages but only recently scrolled ones are worth keeping.
+    CACHE_SIZE = 512
+
     def __init__(self):
-        """Initialize renderer with syntax cache."""
-        self._syntax_cache: Dict[int, Text] = {}
+        """Initialize renderer with bounded rendered-message cache."""
+        self._syntax_cache: "OrderedDict[Tuple, Text]" = OrderedDict()
 
     def render(self, snapshot: DashboardSnapshot, ui_state: DashboardUIState) -> Panel:
         """Render message stream panel with virtual scrolling."""
@@ -734,29 +935,23 @@ class Layer4Renderer:
         viewport_size = 20  # Show 20 messages at a time
         viewport_end = min(viewport_start + viewport_size, total_messages)
 
-        # Render visible messages
-        lines: List[Text] = []
-        for i in range(viewport_start, viewport_end):
-            message = agent.messages[i]
-            message_text = self._render_message(message, i, ui_state)
-            lines.append(message_text)
-            lines.append(Text())  # Blank line between messages
-
-        # Scroll indicator
-        scroll_indicator = self._render_scroll_indicator(
-            viewport_start, viewport_end, total_messages
+        # Footer: scroll indicator + controls
+        footer = (
+            self._render_scroll_indicator(
+                viewport_start, viewport_end, total_messages
+            ),
+            _BLANK_LINE,
+            self._render_controls(),
         )
-        lines.append(scroll_indicator)
-        lines.append(Text())  # Blank line
 
-        # Controls
-        controls = self._render_controls()
-        lines.append(controls)
-
-        content = Group(*lines)
+        # Stream the viewport lazily - messages are rendered (or pulled from
+        # the LRU) as the console consumes them, with no Group/list built
+        content = _MessageStreamBody(
+            self, agent.messages, viewport_start, viewport_end, ui_state, footer
+        )
         return Panel(
             content,
-            title="[bold]Message Stream[/bold]",
+            title=_TITLE_MESSAGE_STREAM,
             border_style="cyan",
             padding=(1, 2),
         )
@@ -766,31 +961,31 @@ class Layer4Renderer:
         if agent_id is None:
             return None
 
-        for agent in snapshot.agents:
-            if agent.agent_id == agent_id:
-                return agent
-
-        return None
+        return snapshot.agents_by_id.get(agent_id)
 
     def _render_message(self, message: MessageEntry, index: int, ui_state: DashboardUIState) -> Text:
         """Render a single message with syntax highlighting."""
-        # Check cache
-        if index in self._syntax_cache:
-            return self._syntax_cache[index]
+        # Check cache - key includes expansion state so toggling a thinking
+        # block re-renders while both states stay independently cacheable
+        cache_key = (index, message.role, index in ui_state.expanded_message_ids)
+        cached = self._syntax_cache.get(cache_key)
+        if cached is not None:
+            self._syntax_cache.move_to_end(cache_key)
+            return cached
 
         text = Text()
 
         # Role prefix with color
         role = message.role.upper()
-        if role == "USER":
-            text.append("→ USER: ", style="bold blue")
-        elif role == "ASSISTANT":
-            text.append("← ASSISTANT: ", style="bold green")
-        elif role.startswith("TOOL_USE"):
+        if role.startswith("TOOL_USE"):
             tool_name = message.content[:50] if message.content else ""
             text.append(f"→ TOOL_USE: {tool_name}", style="bold yellow")
-            self._syntax_cache[index] = text
+            self._cache_store(cache_key, text)
             return text
+
+        prefix = _ROLE_PREFIXES.get(role)
+        if prefix is not None:
+            text.append(prefix[0], style=prefix[1])
         elif role.startswith("TOOL_RESULT"):
             text.append("← TOOL_RESULT: ", style="bold cyan")
         else:
@@ -801,7 +996,7 @@ class Layer4Renderer:
 
         # Check for thinking blocks
         if message.is_thinking:
-            line_count = content.count("\n") + 1
+            line_count = message.line_count
             is_expanded = index in ui_state.expanded_message_ids
 
             if is_expanded:
@@ -827,9 +1022,16 @@ class Layer4Renderer:
                 text.append(content, style="white")
 
         # Cache result
-        self._syntax_cache[index] = text
+        self._cache_store(cache_key, text)
         return text
 
+    def _cache_store(self, cache_key: Tuple, text: Text) -> None:
+        """Insert rendered text, evicting least-recently-used past CACHE_SIZE."""
+        self._syntax_cache[cache_key] = text
+        self._syntax_cache.move_to_end(cache_key)
+        if len(self._syntax_cache) > self.CACHE_SIZE:
+            self._syntax_cache.popitem(last=False)
+
     def _render_scroll_indicator(self, start: int, end: int, total: int) -> Text:
         """Render scroll position indicator."""
         text = Text()
@@ -844,17 +1046,7 @@ class Layer4Renderer:
 
     def _render_controls(self) -> Text:
         """Render keyboard controls."""
-        text = Text()
-        text.append("[↑↓] Scroll", style="cyan")
-        text.append(" | ", style="dim white")
-        text.append("[Enter] Expand", style="cyan")
-        text.append(" | ", style="dim white")
-        text.append("[Space] Toggle thinking", style="yellow")
-        text.append(" | ", style="dim white")
-        text.append("[Esc] Back", style="yellow")
-        text.append(" | ", style="dim white")
-        text.append("[1-9] Switch", style="cyan")
-        return text
+        return _LAYER4_CONTROLS
 
     def _render_empty(self) -> Panel:
         """Render empty state when no messages."""
@@ -864,7 +1056,7 @@ class Layer4Renderer:
         )
         return Panel(
             content,
-            title="[bold]Message Stream[/bold]",
+            title=_TITLE_MESSAGE_STREAM,
             border_style="dim white",
             padding=(5, 2),
         )
@@ -188,6 +188,10 @@ class UnifiedOrchestrator:
             self.v3_orchestrator.sdk_client = self.sdk_client
             self.v3_orchestrator.agent_pool = self.agent_pool
 
+            # The injected instances replace what __init__ saw; rebuild the
+            # availability mask so the execute-path guards see them
+            self.v3_orchestrator._refresh_subsystems()
+
             logger.info("✓ V3 ContextAwareOrchestrator created with shared subsystems")
         except Exception as e:
             logger.error(f"V3 orchestrator initialization failed: {e}")